@@ -1,12 +1,18 @@
 """Log Agent for monitoring runtime logs and extracting error information."""
 
 import asyncio
+import aiofiles
+import os
 import time
 import re
 import sys
 import traceback
 import logging
-from typing import List, Optional, Dict, Any
+import threading
+from collections import Counter, defaultdict, deque
+from itertools import islice
+from types import MappingProxyType
+from typing import Deque, List, Optional, Dict, Any
 from datetime import datetime
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
@@ -14,11 +20,140 @@ from io import StringIO
 
 from ..models.error_models import ErrorContext, ErrorType, ErrorSeverity
 from ..models.mcp_models import MCPRequest, MCPResponse, ErrorAnalysisRequest
-from ..utils.log_utils import parse_error_log, extract_error_info
+from ..utils.log_utils import parse_error_log, extract_error_info, StreamingLogParser
 from ..mcp.client import MCPClient
 from ..mcp.server import MCPServer
 from .process_monitor import ProcessMonitor
 
+# Broadcast batching: the worker drains up to this many errors per wakeup,
+# waiting at most the window for stragglers, so a log burst costs a handful
+# of fan-outs instead of one per error.
+_BROADCAST_BATCH_MAX = 16
+_BROADCAST_WINDOW_SECONDS = 0.05
+_BROADCAST_QUEUE_SIZE = 1000
+
+# Token-bucket bounds for the runtime capture path: a burst of this many
+# errors is admitted at full speed, then intake is throttled to the refill
+# rate so an exception storm cannot monopolize the loop.
+_ERROR_RATE_CAPACITY = 100
+_ERROR_RATE_REFILL_PER_SECOND = 50.0
+_DROP_REPORT_INTERVAL_SECONDS = 10.0
+
+# Cap on retained error history: bounds both memory and the cost of every
+# history scan, which previously grew linearly with process uptime.
+_ERROR_HISTORY_MAX = 10_000
+
+# Static suggestion templates built once at import time; __init__ attaches
+# the per-agent source field a single time and the generators hand out the
+# shared instances.
+_NOT_CALLABLE_TEMPLATE = MappingProxyType({
+    "title": "Fix Function Call",
+    "description": "You're trying to call an object that is not a function",
+    "code_snippet": "# Check if the object is callable\nif callable(my_variable):\n    result = my_variable()",
+    "confidence_score": 0.8,
+    "explanation": "Only functions and classes can be called",
+})
+
+_CHECK_TYPES_TEMPLATE = MappingProxyType({
+    "title": "Check Variable Types",
+    "description": "Verify that variables have the correct types",
+    "code_snippet": "# Check variable types\nprint(type(my_variable))",
+    "confidence_score": 0.7,
+    "explanation": "Type errors occur when operations are performed on incompatible types",
+})
+
+_CHECK_IMPORT_TEMPLATE = MappingProxyType({
+    "title": "Check Import Statement",
+    "description": "Verify the import statement is correct",
+    "code_snippet": "# Check your import statement\nimport module_name",
+    "confidence_score": 0.7,
+    "explanation": "Import errors occur when modules cannot be found or imported",
+})
+
+_SYNTAX_ERROR_TEMPLATE = MappingProxyType({
+    "title": "Fix Syntax Error",
+    "description": "Check for syntax issues like missing parentheses, brackets, or quotes",
+    "code_snippet": "# Review the syntax around the error line",
+    "confidence_score": 0.8,
+    "explanation": "Syntax errors occur when Python cannot parse your code",
+})
+
+_ATTRIBUTE_CHECK_TEMPLATE = MappingProxyType({
+    "title": "Check Object Attributes",
+    "description": "Verify the object has the required attribute",
+    "code_snippet": "# Check available attributes\nprint(dir(my_object))",
+    "confidence_score": 0.8,
+    "explanation": "Attribute errors occur when trying to access non-existent attributes",
+})
+
+_TYPE_ERROR_TEMPLATE = MappingProxyType({
+    "title": "Check argument types",
+    "description": "The function received arguments of incorrect types",
+    "code_snippet": "# Check the expected types for function arguments",
+    "confidence_score": 0.7,
+    "explanation": "Verify that all arguments match the expected types",
+})
+
+_INDEX_ERROR_TEMPLATE = MappingProxyType({
+    "title": "Check list length before indexing",
+    "description": "The list index is out of range",
+    "code_snippet": "if len(my_list) > index:\n    value = my_list[index]",
+    "confidence_score": 0.8,
+    "explanation": "Always check the length of a list before accessing by index",
+})
+
+_KEY_ERROR_TEMPLATE = MappingProxyType({
+    "title": "Use .get() method for safe access",
+    "description": "The dictionary key doesn't exist",
+    "code_snippet": "value = my_dict.get('key', default_value)",
+    "confidence_score": 0.8,
+    "explanation": "Use .get() method to safely access dictionary keys with a default value",
+})
+
+_FILE_NOT_FOUND_TEMPLATE = MappingProxyType({
+    "title": "Check file path",
+    "description": "The file path is incorrect or file doesn't exist",
+    "code_snippet": "import os\nif os.path.exists(file_path):\n    # File exists",
+    "confidence_score": 0.9,
+    "explanation": "Verify the file path and check if the file exists",
+})
+
+# Precompiled message extractors shared by the suggestion generators.
+_NAME_NOT_DEFINED_RE = re.compile(r"name '([^']+)' is not defined")
+_NO_MODULE_RE = re.compile(r"No module named '([^']+)'")
+_CANNOT_IMPORT_RE = re.compile(r"cannot import name '([^']+)'")
+_ATTR_RE = re.compile(r"'([^']+)' object has no attribute '([^']+)'")
+
+# Template-prefix extraction for similarity bucketing: everything before
+# the first quoted token or digit is the stable "template" part of a
+# message ("name 'x' is not defined" -> "name "), capped for hashing.
+_PREFIX_BREAK_RE = re.compile(r"['\"\d]")
+_PREFIX_MAX_CHARS = 64
+
+
+def _message_prefix(lowered_message: str) -> str:
+    match = _PREFIX_BREAK_RE.search(lowered_message, 0, _PREFIX_MAX_CHARS)
+    if match:
+        return lowered_message[:match.start()]
+    return lowered_message[:_PREFIX_MAX_CHARS]
+
+
+# Noise filter for the runtime handler: one alternation over every ignored
+# keyword so emit() does a single scan instead of nine substring checks on
+# a lower-cased copy of each record.
+_IGNORE_RE = re.compile(
+    r"opening handshake failed"
+    r"|did not receive a valid http request"
+    r"|connection closed while reading"
+    r"|stream ends after"
+    r"|invalidmessage"
+    r"|websocket handshake"
+    r"|connection refused"
+    r"|connection timeout"
+    r"|address already in use",
+    re.IGNORECASE,
+)
+
 
 class RuntimeErrorHandler(logging.Handler):
     """Custom logging handler to capture runtime errors."""
@@ -30,13 +165,17 @@ class RuntimeErrorHandler(logging.Handler):
     
     def emit(self, record):
         try:
-            # Extract error information from log record
-            error_message = self.format(record)
+            # Filter noise and shed storm load on the raw record message
+            # before paying for the formatter or a traceback walk
+            if self._should_ignore_error(record.getMessage()):
+                return
             
-            # Filter out WebSocket connection errors and other noise
-            if self._should_ignore_error(error_message):
+            if not self.log_agent._admit_runtime_error():
                 return
             
+            # Record survives: now materialize the full message
+            error_message = self.format(record)
+            
             # Create error context
             error_context = ErrorContext(
                 error_type=ErrorType.UNKNOWN,
@@ -48,70 +187,77 @@ class RuntimeErrorHandler(logging.Handler):
                 stack_trace=traceback.format_exc() if record.exc_info else None,
             )
             
-            # Process the error asynchronously
-            asyncio.create_task(self.log_agent._process_error(error_context, "runtime"))
+            # Process the error asynchronously; emit() can run on any
+            # thread the logging machinery happens to use
+            self.log_agent._submit_from_thread(
+                self.log_agent._process_error(error_context, "runtime")
+            )
             
         except Exception as e:
             print(f"Error in RuntimeErrorHandler: {e}")
     
     def _should_ignore_error(self, error_message: str) -> bool:
         """Check if an error should be ignored (not a real runtime error)."""
-        error_lower = error_message.lower()
-        
-        # Ignore WebSocket connection errors
-        if any(keyword in error_lower for keyword in [
-            "opening handshake failed",
-            "did not receive a valid http request",
-            "connection closed while reading",
-            "stream ends after",
-            "invalidmessage",
-            "websocket handshake"
-        ]):
-            return True
-        
-        # Ignore other connection-related noise
-        if any(keyword in error_lower for keyword in [
-            "connection refused",
-            "connection timeout",
-            "address already in use"
-        ]):
-            return True
-        
-        return False
+        # WebSocket and connection noise, matched in one combined scan
+        return _IGNORE_RE.search(error_message) is not None
+
+
+# Quiet window for coalescing file-modified events: a busy writer can emit
+# hundreds of events per second and each used to trigger a full re-parse.
+_DEBOUNCE_SECONDS = 0.2
 
 
 class LogFileHandler(FileSystemEventHandler):
-    """File system event handler for monitoring log files."""
+    """File system event handler for monitoring log files.
+
+    Modification bursts are debounced per path: each event resets a short
+    timer on the agent loop and the file is parsed once when the path goes
+    quiet, instead of once per event.
+    """
     
     def __init__(self, log_agent, loop: asyncio.AbstractEventLoop = None):
         self.log_agent = log_agent
         self.loop = loop
+        # path -> pending debounce timer; touched only on the loop thread
+        self._pending: Dict[str, asyncio.TimerHandle] = {}
     
     def on_modified(self, event):
         if not event.is_directory and event.src_path.endswith(('.log', '.txt', '.err')):
-            try:
-                if self.loop and self.loop.is_running():
-                    # Schedule coroutine on the main loop from watchdog thread
-                    self.loop.call_soon_threadsafe(asyncio.create_task, self.log_agent.process_log_file(event.src_path))
-                else:
-                    # Fallback best-effort
-                    loop = asyncio.get_event_loop()
-                    if loop.is_running():
-                        loop.create_task(self.log_agent.process_log_file(event.src_path))
-            except RuntimeError:
-                pass
+            self._schedule(event.src_path)
     
     def on_created(self, event):
         if not event.is_directory and event.src_path.endswith(('.log', '.txt', '.err')):
-            try:
-                if self.loop and self.loop.is_running():
-                    self.loop.call_soon_threadsafe(asyncio.create_task, self.log_agent.process_log_file(event.src_path))
-                else:
-                    loop = asyncio.get_event_loop()
-                    if loop.is_running():
-                        loop.create_task(self.log_agent.process_log_file(event.src_path))
-            except RuntimeError:
-                pass
+            self._schedule(event.src_path)
+    
+    def _schedule(self, file_path: str):
+        """Hand the event to the agent loop; runs on the watchdog thread."""
+        try:
+            if self.loop and self.loop.is_running():
+                self.loop.call_soon_threadsafe(self._debounce, file_path)
+            else:
+                # Fallback best-effort: submit from this watchdog thread in
+                # one step; create_task is only valid on the loop thread
+                loop = asyncio.get_event_loop()
+                if loop.is_running():
+                    asyncio.run_coroutine_threadsafe(
+                        self.log_agent.process_log_file(file_path), loop
+                    )
+        except RuntimeError:
+            pass
+    
+    def _debounce(self, file_path: str):
+        """Reset the per-path quiet-window timer; runs on the loop thread."""
+        handle = self._pending.pop(file_path, None)
+        if handle is not None:
+            handle.cancel()
+        self._pending[file_path] = self.loop.call_later(
+            _DEBOUNCE_SECONDS, self._fire, file_path
+        )
+    
+    def _fire(self, file_path: str):
+        """Quiet window elapsed: parse the file once; runs on the loop thread."""
+        self._pending.pop(file_path, None)
+        asyncio.ensure_future(self.log_agent.process_log_file(file_path))
 
 
 class LogAgent:
@@ -123,7 +269,18 @@ class LogAgent:
         self.mcp_server = MCPServer(name, host="localhost", port=8001)
         self.observer = Observer()
         self.monitored_files: List[str] = []
-        self.error_history: List[ErrorContext] = []
+        self.error_history: Deque[ErrorContext] = deque(maxlen=_ERROR_HISTORY_MAX)
+        # Similarity index: per-error-type buckets of (lowered message,
+        # error), maintained by _remember so lookups start from the right
+        # bucket instead of scanning the whole history.
+        self._by_type: Dict[str, Deque] = defaultdict(deque)
+        # Secondary index keyed by (type, template prefix): errors sharing
+        # a message template land in the same bucket, so the common case
+        # of a repeating error is a dict probe instead of a substring scan
+        self._by_prefix: Dict[tuple, Deque] = defaultdict(deque)
+        # Running error-type distribution, kept current by _remember so the
+        # log-context handler answers in O(1) instead of rescanning history.
+        self._type_counter: Counter = Counter()
         self.running = False
         
         # Runtime error monitoring
@@ -142,6 +299,56 @@ class LogAgent:
         
         # Main event loop reference (populated on start)
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Canonical per-agent instances of the static templates; shared by
+        # reference on every call (consumers treat suggestions as read-only
+        # payloads, and they must stay plain dicts for JSON serialization)
+        self._not_callable_suggestion = dict(_NOT_CALLABLE_TEMPLATE, agent_source=name)
+        self._check_types_suggestion = dict(_CHECK_TYPES_TEMPLATE, agent_source=name)
+        self._check_import_suggestion = dict(_CHECK_IMPORT_TEMPLATE, agent_source=name)
+        self._syntax_error_suggestion = dict(_SYNTAX_ERROR_TEMPLATE, agent_source=name)
+        self._attribute_check_suggestion = dict(_ATTRIBUTE_CHECK_TEMPLATE, agent_source=name)
+        self._type_error_suggestion = dict(_TYPE_ERROR_TEMPLATE, agent_source=name)
+        self._index_error_suggestion = dict(_INDEX_ERROR_TEMPLATE, agent_source=name)
+        self._key_error_suggestion = dict(_KEY_ERROR_TEMPLATE, agent_source=name)
+        self._file_not_found_suggestion = dict(_FILE_NOT_FOUND_TEMPLATE, agent_source=name)
+        
+        # Error types whose suggestions don't depend on the message are a
+        # static table of prebuilt tuples; only the generators that parse
+        # the message remain callables
+        self._static_fix_suggestions = {
+            "TYPE_ERROR": (self._type_error_suggestion,),
+            "INDEX_ERROR": (self._index_error_suggestion,),
+            "KEY_ERROR": (self._key_error_suggestion,),
+            "FILE_NOT_FOUND": (self._file_not_found_suggestion,),
+        }
+        
+        # Dispatch table for the message-dependent fix-suggestion
+        # generators, mirroring the code agent's generator table
+        self._fix_suggestion_generators = {
+            "NAME_ERROR": self._generate_name_error_suggestions,
+            "IMPORT_ERROR": self._generate_import_error_suggestions,
+            "ATTRIBUTE_ERROR": self._generate_attribute_error_suggestions,
+        }
+        
+        # Incremental parsing state: path -> (inode, byte offset of the
+        # first unparsed line), so a modify event re-reads only the new
+        # tail instead of the whole file
+        self._file_offsets: Dict[str, tuple] = {}
+        
+        # Broadcast pipeline: errors queue up here and a single background
+        # worker fans them out in batches
+        self._broadcast_q: asyncio.Queue = asyncio.Queue(maxsize=_BROADCAST_QUEUE_SIZE)
+        self._broadcast_task: Optional[asyncio.Task] = None
+        self._broadcast_dropped = 0
+        
+        # Token bucket guarding the runtime capture path; emit() runs on
+        # arbitrary threads, hence the lock
+        self._rate_tokens = float(_ERROR_RATE_CAPACITY)
+        self._rate_last_refill = time.monotonic()
+        self._rate_dropped = 0
+        self._rate_last_report = time.monotonic()
+        self._rate_lock = threading.Lock()
     
     async def start(self):
         """Start the log agent."""
@@ -170,6 +377,15 @@ class LogAgent:
         """Stop the log agent."""
         self.running = False
         
+        # Stop the broadcast worker
+        if self._broadcast_task is not None:
+            self._broadcast_task.cancel()
+            try:
+                await self._broadcast_task
+            except asyncio.CancelledError:
+                pass
+            self._broadcast_task = None
+        
         # Stop runtime monitoring
         await self._stop_runtime_monitoring()
         
@@ -215,6 +431,9 @@ class LogAgent:
     def _custom_excepthook(self, exc_type, exc_value, exc_traceback):
         """Custom exception hook to capture unhandled exceptions."""
         try:
+            if not self._admit_runtime_error():
+                self.original_excepthook(exc_type, exc_value, exc_traceback)
+                return
             # Create error context from exception
             error_context = ErrorContext(
                 error_type=self._map_exception_type(exc_type),
@@ -227,7 +446,7 @@ class LogAgent:
             )
             
             # Process the error asynchronously
-            asyncio.create_task(self._process_error(error_context, "unhandled_exception"))
+            self._submit_from_thread(self._process_error(error_context, "unhandled_exception"))
             
         except Exception as e:
             print(f"Error in custom excepthook: {e}")
@@ -235,6 +454,50 @@ class LogAgent:
         # Call original excepthook
         self.original_excepthook(exc_type, exc_value, exc_traceback)
     
+    def _admit_runtime_error(self) -> bool:
+        """Token-bucket admission for runtime-captured errors.
+
+        Thread-safe; returns False when the bucket is empty, periodically
+        printing how many errors were shed so storms stay visible without
+        per-drop noise.
+        """
+        now = time.monotonic()
+        with self._rate_lock:
+            self._rate_tokens = min(
+                float(_ERROR_RATE_CAPACITY),
+                self._rate_tokens + (now - self._rate_last_refill) * _ERROR_RATE_REFILL_PER_SECOND,
+            )
+            self._rate_last_refill = now
+            if self._rate_tokens >= 1.0:
+                self._rate_tokens -= 1.0
+                return True
+            self._rate_dropped += 1
+            if now - self._rate_last_report >= _DROP_REPORT_INTERVAL_SECONDS:
+                print(f"Rate limit: {self._rate_dropped} runtime errors dropped")
+                self._rate_dropped = 0
+                self._rate_last_report = now
+            return False
+    
+    def _submit_from_thread(self, coro) -> None:
+        """Schedule a coroutine on the agent loop from any thread.
+
+        Logging handlers and excepthooks run on whatever thread raised, so
+        create_task is only safe when that thread happens to be the loop
+        thread. The captured loop gets the coroutine in one thread-safe
+        step; with no agent loop, fall back to the caller's running loop or
+        drop the work rather than raise on the logging path.
+        """
+        loop = self._loop
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(coro, loop)
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            coro.close()
+            return
+        asyncio.create_task(coro)
+    
     def _map_exception_type(self, exc_type) -> ErrorType:
         """Map Python exception types to ErrorType enum."""
         type_mapping = {
@@ -261,9 +524,12 @@ class LogAgent:
             "./tmp",
         ]
         
+        # One handler shared across every watched directory, so the
+        # per-path debounce timers and offset state are consolidated in a
+        # single place instead of duplicated per watch
+        handler = LogFileHandler(self, loop=self._loop)
         for directory in log_directories:
             try:
-                handler = LogFileHandler(self, loop=self._loop)
                 self.observer.schedule(handler, directory, recursive=False)
                 print(f"Monitoring log directory: {directory}")
             except Exception as e:
@@ -275,16 +541,43 @@ class LogAgent:
         """Process a log file and extract errors."""
         try:
             print(f"Processing log file: {file_path}")
-            # Read the log file
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
+            # Resume from the last parsed offset when the file is unchanged
+            # (same inode, not truncated); otherwise start from the top
+            loop = asyncio.get_running_loop()
+            stat = await loop.run_in_executor(None, os.stat, file_path)
+            offset = 0
+            known = self._file_offsets.get(file_path)
+            if known is not None and known[0] == stat.st_ino and known[1] <= stat.st_size:
+                offset = known[1]
             
-            # Parse errors from the log content
-            errors = parse_error_log(content)
+            # Stream the tail in line batches: parsing starts while the rest
+            # of the file is still being read and peak memory stays bounded
+            # by the parser's block size instead of the file size
+            parser = StreamingLogParser()
+            batch: List[str] = []
+            consumed = offset
+            async with aiofiles.open(file_path, mode='rb') as file:
+                if offset:
+                    await file.seek(offset)
+                async for raw_line in file:
+                    if not raw_line.endswith(b'\n'):
+                        # Partial trailing line still being written; leave it
+                        # for the next event
+                        break
+                    consumed += len(raw_line)
+                    batch.append(raw_line.decode('utf-8').rstrip('\n'))
+                    if len(batch) >= 512:
+                        for error in parser.feed(batch):
+                            await self._process_error(error, file_path)
+                        batch = []
             
-            # Process each error
-            for error in errors:
+            if batch:
+                for error in parser.feed(batch):
+                    await self._process_error(error, file_path)
+            for error in parser.finish():
                 await self._process_error(error, file_path)
+            
+            self._file_offsets[file_path] = (stat.st_ino, consumed)
                 
         except Exception as e:
             print(f"Error processing log file {file_path}: {e}")
@@ -294,29 +587,74 @@ class LogAgent:
         # Add source file information
         error.additional_context["source_file"] = source_file
         
-        # Add to error history
-        self.error_history.append(error)
+        # Parse the variable/module name out of the message once at ingest
+        # so downstream suggestion passes reuse it instead of re-running
+        # the extractors per field
+        if error.error_type == ErrorType.NAME_ERROR:
+            match = _NAME_NOT_DEFINED_RE.search(error.error_message)
+            if match:
+                error.additional_context["parsed_name"] = match.group(1)
+        elif error.error_type == ErrorType.IMPORT_ERROR:
+            match = _NO_MODULE_RE.search(error.error_message)
+            if match:
+                error.additional_context["parsed_module"] = match.group(1)
         
-        # Broadcast error to other agents
-        await self._broadcast_error(error)
+        # Add to error history and the similarity index
+        self._remember(error)
+        
+        # Build the wire payload once here, where the error fields are
+        # already in hand; broadcasting then marshals nothing
+        payload = {
+            "error_type": error.error_type.value,
+            "error_message": error.error_message,
+            "file_path": error.file_path,
+            "line_number": error.line_number,
+            "function_name": error.function_name,
+            "stack_trace": error.stack_trace,
+            "severity": error.severity.value,
+            "timestamp": error.timestamp.isoformat(),
+            "additional_context": error.additional_context,
+        }
+        
+        # Queue the payload for the batching broadcast worker; when the
+        # queue is saturated the broadcast is shed (the error is still
+        # recorded)
+        if self._broadcast_task is None or self._broadcast_task.done():
+            self._broadcast_task = asyncio.create_task(self._broadcast_worker())
+        try:
+            self._broadcast_q.put_nowait(payload)
+        except asyncio.QueueFull:
+            self._broadcast_dropped += 1
+            if self._broadcast_dropped % 100 == 1:
+                print(f"Broadcast queue full: {self._broadcast_dropped} errors not broadcast")
         
         print(f"Processed error: {error.error_type} - {error.error_message}")
     
-    async def _broadcast_error(self, error: ErrorContext):
-        """Broadcast error to other agents via MCP."""
+    async def _broadcast_worker(self):
+        """Drain queued errors and broadcast them in small batches.
+
+        One worker wakes per error burst, gathers stragglers for up to the
+        batch window, then fans the batch out concurrently -- bounding the
+        number of broadcast round-trips under load instead of paying one
+        per error.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._broadcast_q.get()]
+            deadline = loop.time() + _BROADCAST_WINDOW_SECONDS
+            while len(batch) < _BROADCAST_BATCH_MAX:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._broadcast_q.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await asyncio.gather(*(self._broadcast_error(payload) for payload in batch))
+    
+    async def _broadcast_error(self, error_data: Dict[str, Any]):
+        """Broadcast a pre-serialized error payload to other agents via MCP."""
         try:
-            error_data = {
-                "error_type": error.error_type.value,
-                "error_message": error.error_message,
-                "file_path": error.file_path,
-                "line_number": error.line_number,
-                "function_name": error.function_name,
-                "stack_trace": error.stack_trace,
-                "severity": error.severity.value,
-                "timestamp": error.timestamp.isoformat(),
-                "additional_context": error.additional_context,
-            }
-            
             responses = await self.mcp_client.broadcast_error(error_data)
             
             for response in responses:
@@ -355,7 +693,7 @@ class LogAgent:
         """Handle log context request from other agents."""
         try:
             # Return recent error history
-            recent_errors = self.error_history[-10:]  # Last 10 errors
+            recent_errors = self._recent(10)  # Last 10 errors
             
             return {
                 "recent_errors": [error.model_dump() for error in recent_errors],
@@ -366,7 +704,7 @@ class LogAgent:
         except Exception as e:
             return {"error": str(e)}
     
-    async def _handle_ping(self, request: MCPRequest) -> Dict[str, Any]:
+    def _handle_ping(self, request: MCPRequest) -> Dict[str, Any]:
         """Handle ping request for health checks."""
         try:
             return {
@@ -403,18 +741,57 @@ class LogAgent:
         except Exception as e:
             return {"error": str(e)}
     
-    def _find_similar_errors(self, error_context: Dict[str, Any]) -> List[ErrorContext]:
-        """Find similar errors in the error history."""
+    def _remember(self, error: ErrorContext):
+        """Append an error to the history and the per-type similarity index.
+
+        The lowered message is computed once here so similarity searches
+        never re-lowercase stored errors. When the bounded history is full,
+        the evicted (oldest) error is also dropped from its bucket to keep
+        the index coherent.
+        """
+        if len(self.error_history) == _ERROR_HISTORY_MAX:
+            evicted = self.error_history[0]
+            evicted_type = evicted.error_type.value
+            bucket = self._by_type.get(evicted_type)
+            if bucket:
+                lowered, _ = bucket.popleft()
+                prefix_bucket = self._by_prefix.get((evicted_type, _message_prefix(lowered)))
+                if prefix_bucket:
+                    prefix_bucket.popleft()
+            self._type_counter[evicted_type] -= 1
+            if not self._type_counter[evicted_type]:
+                del self._type_counter[evicted_type]
+        self.error_history.append(error)
+        error_type = error.error_type.value
+        lowered_message = error.message_lower
+        self._by_type[error_type].append((lowered_message, error))
+        self._by_prefix[(error_type, _message_prefix(lowered_message))].append(error)
+        self._type_counter[error_type] += 1
+    
+    def _find_similar_errors(self, error_context: Dict[str, Any], limit: int = 100) -> List[ErrorContext]:
+        """Find similar errors in the error history.
+
+        At most limit matches are returned; the callers only branch on
+        rough frequency and min/max timestamps, so collecting every match
+        from a large bucket would be wasted work.
+        """
         similar_errors = []
         target_error_type = error_context.get("error_type")
         target_message = error_context.get("error_message", "").lower()
         
-        for error in self.error_history:
-            # Check if error types match
-            if error.error_type.value == target_error_type:
-                # Check if error messages are similar
-                if target_message in error.error_message.lower() or error.error_message.lower() in target_message:
-                    similar_errors.append(error)
+        # Fast path: errors sharing the target's template prefix live in
+        # one bucket, so a repeat of a known error is a single dict probe
+        prefix_bucket = self._by_prefix.get((target_error_type, _message_prefix(target_message)))
+        if prefix_bucket:
+            return list(islice(prefix_bucket, limit))
+        
+        # Fallback for messages whose template prefix has not been seen:
+        # scan the type bucket against messages lowered once at insertion
+        for lowered_message, error in self._by_type.get(target_error_type, ()):
+            if target_message in lowered_message or lowered_message in target_message:
+                similar_errors.append(error)
+                if len(similar_errors) >= limit:
+                    break
         
         return similar_errors
     
@@ -472,10 +849,12 @@ class LogAgent:
         
         # Generate specific suggestions based on error type
         if error_type == "name_error":
+            # One regex pull reused by every field below
+            var_name = self._extract_variable_name(error_message)
             suggestions.append({
                 "title": "Define Variable",
-                "description": f"Variable '{self._extract_variable_name(error_message)}' is not defined",
-                "code_snippet": f"# Define the variable before using it\n{self._extract_variable_name(error_message)} = some_value",
+                "description": f"Variable '{var_name}' is not defined",
+                "code_snippet": f"# Define the variable before using it\n{var_name} = some_value",
                 "confidence_score": 0.9,
                 "agent_source": self.name,
                 "explanation": "Variables must be defined before they can be used"
@@ -483,23 +862,9 @@ class LogAgent:
         
         elif error_type == "type_error":
             if "object is not callable" in error_message.lower():
-                suggestions.append({
-                    "title": "Fix Function Call",
-                    "description": "You're trying to call an object that is not a function",
-                    "code_snippet": "# Check if the object is callable\nif callable(my_variable):\n    result = my_variable()",
-                    "confidence_score": 0.8,
-                    "agent_source": self.name,
-                    "explanation": "Only functions and classes can be called"
-                })
+                suggestions.append(self._not_callable_suggestion)
             else:
-                suggestions.append({
-                    "title": "Check Variable Types",
-                    "description": "Verify that variables have the correct types",
-                    "code_snippet": "# Check variable types\nprint(type(my_variable))",
-                    "confidence_score": 0.7,
-                    "agent_source": self.name,
-                    "explanation": "Type errors occur when operations are performed on incompatible types"
-                })
+                suggestions.append(self._check_types_suggestion)
         
         elif error_type == "import_error" or error_type == "module_not_found":
             module_name = self._extract_module_name(error_message)
@@ -513,34 +878,13 @@ class LogAgent:
                     "explanation": f"The module '{module_name}' is not installed in your environment"
                 })
             else:
-                suggestions.append({
-                    "title": "Check Import Statement",
-                    "description": "Verify the import statement is correct",
-                    "code_snippet": "# Check your import statement\nimport module_name",
-                    "confidence_score": 0.7,
-                    "agent_source": self.name,
-                    "explanation": "Import errors occur when modules cannot be found or imported"
-                })
+                suggestions.append(self._check_import_suggestion)
         
         elif error_type == "syntax_error":
-            suggestions.append({
-                "title": "Fix Syntax Error",
-                "description": "Check for syntax issues like missing parentheses, brackets, or quotes",
-                "code_snippet": "# Review the syntax around the error line",
-                "confidence_score": 0.8,
-                "agent_source": self.name,
-                "explanation": "Syntax errors occur when Python cannot parse your code"
-            })
+            suggestions.append(self._syntax_error_suggestion)
         
         elif error_type == "attribute_error":
-            suggestions.append({
-                "title": "Check Object Attributes",
-                "description": "Verify the object has the required attribute",
-                "code_snippet": "# Check available attributes\nprint(dir(my_object))",
-                "confidence_score": 0.8,
-                "agent_source": self.name,
-                "explanation": "Attribute errors occur when trying to access non-existent attributes"
-            })
+            suggestions.append(self._attribute_check_suggestion)
         
         # Add frequency-based suggestions
         if len(errors) > 5:
@@ -557,21 +901,17 @@ class LogAgent:
     
     def _extract_variable_name(self, error_message: str) -> str:
         """Extract variable name from NameError message."""
-        match = re.search(r"name '([^']+)' is not defined", error_message)
+        match = _NAME_NOT_DEFINED_RE.search(error_message)
         return match.group(1) if match else "variable_name"
-    
+
     def _extract_module_name(self, error_message: str) -> str:
         """Extract module name from ImportError message."""
-        match = re.search(r"No module named '([^']+)'", error_message)
+        match = _NO_MODULE_RE.search(error_message)
         return match.group(1) if match else "module_name"
     
     def _get_error_type_distribution(self) -> Dict[str, int]:
         """Get distribution of error types in history."""
-        distribution = {}
-        for error in self.error_history:
-            error_type = error.error_type.value
-            distribution[error_type] = distribution.get(error_type, 0) + 1
-        return distribution
+        return dict(self._type_counter)
     
     async def connect_to_agent(self, agent_name: str, connection_info: Dict[str, Any]):
         """Connect to another agent."""
@@ -579,11 +919,16 @@ class LogAgent:
     
     def get_error_history(self) -> List[ErrorContext]:
         """Get the error history."""
-        return self.error_history.copy()
+        return list(self.error_history)
     
     def get_recent_errors(self, count: int = 10) -> List[ErrorContext]:
         """Get recent errors."""
-        return self.error_history[-count:] 
+        return self._recent(count)
+    
+    def _recent(self, count: int) -> List[ErrorContext]:
+        """Last count entries of the history deque without copying it all."""
+        start = max(0, len(self.error_history) - count)
+        return list(islice(self.error_history, start, None))
 
     def _generate_fix_suggestions(self, error_context: Dict[str, Any], similar_errors: List[ErrorContext]) -> List[Dict[str, Any]]:
         """Generate fix suggestions based on error context and similar errors."""
@@ -593,21 +938,15 @@ class LogAgent:
         error_type = error_context.get("error_type", "unknown")
         error_message = error_context.get("error_message", "")
         
-        # Generate suggestions based on error type
-        if error_type == "NAME_ERROR":
-            suggestions.extend(self._generate_name_error_suggestions(error_message))
-        elif error_type == "IMPORT_ERROR":
-            suggestions.extend(self._generate_import_error_suggestions(error_message))
-        elif error_type == "ATTRIBUTE_ERROR":
-            suggestions.extend(self._generate_attribute_error_suggestions(error_message))
-        elif error_type == "TYPE_ERROR":
-            suggestions.extend(self._generate_type_error_suggestions(error_message))
-        elif error_type == "INDEX_ERROR":
-            suggestions.extend(self._generate_index_error_suggestions(error_message))
-        elif error_type == "KEY_ERROR":
-            suggestions.extend(self._generate_key_error_suggestions(error_message))
-        elif error_type == "FILE_NOT_FOUND":
-            suggestions.extend(self._generate_file_not_found_suggestions(error_message))
+        # Generate suggestions based on error type: static payloads come
+        # straight from the table, the rest via one generator probe
+        static = self._static_fix_suggestions.get(error_type)
+        if static is not None:
+            suggestions.extend(static)
+        else:
+            generator = self._fix_suggestion_generators.get(error_type)
+            if generator is not None:
+                suggestions.extend(generator(error_message))
         
         # Add suggestions based on similar errors
         if similar_errors:
@@ -620,8 +959,7 @@ class LogAgent:
         suggestions = []
         
         # Extract variable name from error message
-        import re
-        match = re.search(r"name '([^']+)' is not defined", error_message)
+        match = _NAME_NOT_DEFINED_RE.search(error_message)
         if match:
             var_name = match.group(1)
             suggestions.append({
@@ -650,8 +988,7 @@ class LogAgent:
         suggestions = []
         
         # Extract module name from error message
-        import re
-        match = re.search(r"No module named '([^']+)'", error_message)
+        match = _NO_MODULE_RE.search(error_message)
         if match:
             module_name = match.group(1)
             suggestions.append({
@@ -663,7 +1000,7 @@ class LogAgent:
                 "explanation": f"Module '{module_name}' needs to be installed using pip"
             })
         
-        match = re.search(r"cannot import name '([^']+)'", error_message)
+        match = _CANNOT_IMPORT_RE.search(error_message)
         if match:
             import_name = match.group(1)
             suggestions.append({
@@ -682,8 +1019,7 @@ class LogAgent:
         suggestions = []
         
         # Extract object and attribute from error message
-        import re
-        match = re.search(r"'([^']+)' object has no attribute '([^']+)'", error_message)
+        match = _ATTR_RE.search(error_message)
         if match:
             object_type = match.group(1)
             attribute = match.group(2)
@@ -698,78 +1034,15 @@ class LogAgent:
         
         return suggestions
     
-    def _generate_type_error_suggestions(self, error_message: str) -> List[Dict[str, Any]]:
-        """Generate suggestions for TypeError."""
-        suggestions = []
-        
-        suggestions.append({
-            "title": "Check argument types",
-            "description": "The function received arguments of incorrect types",
-            "code_snippet": "# Check the expected types for function arguments",
-            "confidence_score": 0.7,
-            "agent_source": self.name,
-            "explanation": "Verify that all arguments match the expected types"
-        })
-        
-        return suggestions
-    
-    def _generate_index_error_suggestions(self, error_message: str) -> List[Dict[str, Any]]:
-        """Generate suggestions for IndexError."""
-        suggestions = []
-        
-        suggestions.append({
-            "title": "Check list length before indexing",
-            "description": "The list index is out of range",
-            "code_snippet": "if len(my_list) > index:\n    value = my_list[index]",
-            "confidence_score": 0.8,
-            "agent_source": self.name,
-            "explanation": "Always check the length of a list before accessing by index"
-        })
-        
-        return suggestions
-    
-    def _generate_key_error_suggestions(self, error_message: str) -> List[Dict[str, Any]]:
-        """Generate suggestions for KeyError."""
-        suggestions = []
-        
-        suggestions.append({
-            "title": "Use .get() method for safe access",
-            "description": "The dictionary key doesn't exist",
-            "code_snippet": "value = my_dict.get('key', default_value)",
-            "confidence_score": 0.8,
-            "agent_source": self.name,
-            "explanation": "Use .get() method to safely access dictionary keys with a default value"
-        })
-        
-        return suggestions
-    
-    def _generate_file_not_found_suggestions(self, error_message: str) -> List[Dict[str, Any]]:
-        """Generate suggestions for FileNotFoundError."""
-        suggestions = []
-        
-        suggestions.append({
-            "title": "Check file path",
-            "description": "The file path is incorrect or file doesn't exist",
-            "code_snippet": "import os\nif os.path.exists(file_path):\n    # File exists",
-            "confidence_score": 0.9,
-            "agent_source": self.name,
-            "explanation": "Verify the file path and check if the file exists"
-        })
-        
-        return suggestions
-    
     def _generate_similar_error_suggestions(self, similar_errors: List[ErrorContext]) -> List[Dict[str, Any]]:
         """Generate suggestions based on similar errors in history."""
         suggestions = []
         
         # Find most common patterns
-        error_types = {}
-        for error in similar_errors:
-            error_type = error.error_type.value
-            error_types[error_type] = error_types.get(error_type, 0) + 1
+        error_types = Counter(error.error_type.value for error in similar_errors)
         
         # Suggest based on frequency
-        for error_type, count in sorted(error_types.items(), key=lambda x: x[1], reverse=True):
+        for error_type, count in error_types.most_common():
             if count > 1:
                 suggestions.append({
                     "title": f"Recurring {error_type} pattern",
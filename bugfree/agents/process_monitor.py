@@ -1,7 +1,6 @@
 """Process monitor for detecting Python errors from any process."""
 
 import asyncio
-import subprocess
 import sys
 import os
 import re
@@ -10,6 +9,45 @@ from datetime import datetime
 
 from ..models.error_models import ErrorContext, ErrorType, ErrorSeverity
 
+# Every marker is a literal string, so a single alternation gives one
+# linear scan per line instead of eleven separate regex invocations
+_PYTHON_ERROR_KEYWORDS = (
+    "Traceback (most recent call last):",
+    "NameError:",
+    "TypeError:",
+    "AttributeError:",
+    "ImportError:",
+    "SyntaxError:",
+    "FileNotFoundError:",
+    "IndexError:",
+    "KeyError:",
+    "ValueError:",
+    "ZeroDivisionError:",
+)
+_PYTHON_ERROR_RE = re.compile(
+    "|".join(re.escape(keyword) for keyword in _PYTHON_ERROR_KEYWORDS)
+)
+
+# Case-insensitive probe for python interpreters in a command line,
+# replacing a full .lower() copy of every candidate line
+_PYTHON_CMD_RE = re.compile(r"python", re.IGNORECASE)
+
+# Matched keyword -> error type, so detection and classification share one
+# scan; the traceback header announces an error without naming its type
+_KEYWORD_TO_ERROR_TYPE = {
+    "Traceback (most recent call last):": ErrorType.UNKNOWN,
+    "NameError:": ErrorType.NAME_ERROR,
+    "TypeError:": ErrorType.TYPE_ERROR,
+    "AttributeError:": ErrorType.ATTRIBUTE_ERROR,
+    "ImportError:": ErrorType.IMPORT_ERROR,
+    "SyntaxError:": ErrorType.SYNTAX_ERROR,
+    "FileNotFoundError:": ErrorType.FILE_NOT_FOUND,
+    "IndexError:": ErrorType.INDEX_ERROR,
+    "KeyError:": ErrorType.KEY_ERROR,
+    "ValueError:": ErrorType.VALUE_ERROR,
+    "ZeroDivisionError:": ErrorType.ZERO_DIVISION_ERROR,
+}
+
 
 class ProcessMonitor:
     """Monitor Python processes for errors."""
@@ -18,6 +56,12 @@ class ProcessMonitor:
         self.log_agent = log_agent
         self.running = False
         self.monitored_processes = set()
+        # pid -> command from the previous /proc sweep; a pid seen last
+        # cycle keeps its cached cmdline instead of being re-read
+        self._proc_cache = {}
+        # pid -> pidfd for event-driven exit notification (Linux 5.3+);
+        # pids without an entry fall back to the os.kill(pid, 0) sweep
+        self._pidfds = {}
         
     async def start(self):
         """Start monitoring Python processes."""
@@ -30,6 +74,11 @@ class ProcessMonitor:
     async def stop(self):
         """Stop monitoring."""
         self.running = False
+        loop = asyncio.get_running_loop()
+        for pid, pidfd in list(self._pidfds.items()):
+            loop.remove_reader(pidfd)
+            os.close(pidfd)
+        self._pidfds.clear()
         print("Process monitoring stopped")
     
     async def _monitor_python_processes(self):
@@ -44,6 +93,7 @@ class ProcessMonitor:
                     if process_info['pid'] not in self.monitored_processes:
                         await self._monitor_process(process_info)
                         self.monitored_processes.add(process_info['pid'])
+                        self._watch_pid_exit(process_info['pid'])
                 
                 # Clean up finished processes
                 await self._cleanup_finished_processes()
@@ -59,37 +109,78 @@ class ProcessMonitor:
         """Find all running Python processes."""
         try:
             if sys.platform == "darwin":  # macOS
-                result = subprocess.run(
-                    ["ps", "-eo", "pid,command"],
-                    capture_output=True,
-                    text=True
+                # Async subprocess so the fork+read doesn't stall the
+                # event loop for the duration of ps
+                proc = await asyncio.create_subprocess_exec(
+                    "ps", "-eo", "pid,command",
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
                 )
-            else:  # Linux
-                result = subprocess.run(
-                    ["ps", "-eo", "pid,cmd"],
-                    capture_output=True,
-                    text=True
-                )
-            
-            processes = []
-            for line in result.stdout.split('\n'):
-                if 'python' in line.lower() and 'run_bugfree.py' not in line:
-                    # Parse process info
-                    parts = line.strip().split()
-                    if parts:
-                        pid = int(parts[0])
-                        command = ' '.join(parts[1:])
-                        processes.append({
-                            'pid': pid,
-                            'command': command
-                        })
+                stdout, _ = await proc.communicate()
+
+                processes = []
+                for line in stdout.decode().split('\n'):
+                    if _PYTHON_CMD_RE.search(line) and 'run_bugfree.py' not in line:
+                        # Parse process info
+                        parts = line.strip().split()
+                        if parts:
+                            pid = int(parts[0])
+                            command = ' '.join(parts[1:])
+                            processes.append({
+                                'pid': pid,
+                                'command': command
+                            })
+                
+                return processes
             
-            return processes
+            # Linux: scan /proc directly instead of forking ps every cycle;
+            # the small-file reads run on the executor so the loop never
+            # blocks on procfs
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._scan_proc_for_python)
             
         except Exception as e:
             print(f"Error finding Python processes: {e}")
             return []
     
+    def _scan_proc_for_python(self) -> List[dict]:
+        """Walk /proc for Python processes without forking a child.
+
+        Reads each numeric entry's cmdline (null-separated argv) and keeps
+        the same python / run_bugfree.py filter the ps path applies. A pid
+        already seen on the previous sweep reuses its cached command, so a
+        steady-state cycle costs one scandir and zero cmdline reads.
+        """
+        processes = []
+        seen = {}
+        try:
+            with os.scandir("/proc") as entries:
+                for entry in entries:
+                    if not entry.name.isdigit():
+                        continue
+                    pid = int(entry.name)
+                    command = self._proc_cache.get(pid)
+                    if command is None:
+                        try:
+                            with open(f"/proc/{entry.name}/cmdline", "rb") as file:
+                                command = file.read().replace(b"\0", b" ").decode(
+                                    "utf-8", "replace").strip()
+                        except OSError:
+                            # Process exited between scandir and read
+                            continue
+                    seen[pid] = command
+                    if _PYTHON_CMD_RE.search(command) and 'run_bugfree.py' not in command:
+                        processes.append({
+                            'pid': pid,
+                            'command': command,
+                        })
+        except OSError as e:
+            print(f"Error scanning /proc: {e}")
+        # Dropping vanished pids also keeps reused pids from inheriting a
+        # stale command
+        self._proc_cache = seen
+        return processes
+    
     async def _monitor_process(self, process_info: dict):
         """Monitor a specific Python process for errors."""
         try:
@@ -110,29 +201,41 @@ class ProcessMonitor:
         try:
             # Use log stream to monitor Python errors
             cmd = [
-                "log", "stream", 
+                "log", "stream",
                 "--predicate", "process == 'python' OR process == 'python3'",
-                "--level", "error"
+                "--level", "error",
+                "--style", "compact"
             ]
-            
+
             process = await asyncio.create_subprocess_exec(
                 *cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE
             )
-            
+
+            # Read the stream in large chunks instead of one asyncio
+            # readline per log line; bursts then cost one await per 64 KiB
+            buffer = b""
             while self.running:
                 try:
-                    line = await asyncio.wait_for(process.stdout.readline(), timeout=1.0)
-                    if line:
-                        line_str = line.decode().strip()
-                        if self._is_python_error(line_str):
-                            await self._process_error_line(line_str)
+                    chunk = await asyncio.wait_for(process.stdout.read(65536), timeout=1.0)
                 except asyncio.TimeoutError:
                     continue
                 except Exception as e:
                     print(f"Error reading log stream: {e}")
                     break
+                if not chunk:
+                    break
+                buffer += chunk
+                lines = buffer.split(b"\n")
+                # The last element is an incomplete tail; keep it for the
+                # next chunk
+                buffer = lines.pop()
+                for raw_line in lines:
+                    line_str = raw_line.decode().strip()
+                    match = _PYTHON_ERROR_RE.search(line_str)
+                    if match:
+                        await self._process_error_line(line_str, match)
                     
         except Exception as e:
             print(f"Error setting up macOS log monitoring: {e}")
@@ -150,33 +253,30 @@ class ProcessMonitor:
     
     def _is_python_error(self, line: str) -> bool:
         """Check if a log line contains a Python error."""
-        error_patterns = [
-            r"Traceback \(most recent call last\):",
-            r"NameError:",
-            r"TypeError:",
-            r"AttributeError:",
-            r"ImportError:",
-            r"SyntaxError:",
-            r"FileNotFoundError:",
-            r"IndexError:",
-            r"KeyError:",
-            r"ValueError:",
-            r"ZeroDivisionError:",
-        ]
-        
-        return any(re.search(pattern, line) for pattern in error_patterns)
+        return _PYTHON_ERROR_RE.search(line) is not None
     
-    async def _process_error_line(self, error_line: str):
-        """Process an error line from system logs."""
+    async def _process_error_line(self, error_line: str, match: Optional[re.Match] = None):
+        """Process an error line from system logs.
+
+        ``match`` is the detection match when the caller already scanned the
+        line, so classification reuses it instead of rescanning.
+        """
         try:
+            if match is None:
+                match = _PYTHON_ERROR_RE.search(error_line)
+            error_type = (
+                _KEYWORD_TO_ERROR_TYPE[match.group(0)] if match else ErrorType.UNKNOWN
+            )
             # Create error context from log line
             error_context = ErrorContext(
-                error_type=self._extract_error_type(error_line),
+                error_type=error_type,
                 error_message=error_line,
                 file_path="unknown",
                 line_number=1,
                 severity=ErrorSeverity.HIGH,
-                timestamp=datetime.now().isoformat(),
+                # Pass the datetime directly: isoformat() here only made
+                # pydantic parse the string straight back into a datetime
+                timestamp=datetime.now(),
             )
             
             # Send to log agent for processing
@@ -187,42 +287,54 @@ class ProcessMonitor:
     
     def _extract_error_type(self, error_line: str) -> ErrorType:
         """Extract error type from error line."""
-        error_line_lower = error_line.lower()
-        
-        if "nameerror" in error_line_lower:
-            return ErrorType.NAME_ERROR
-        elif "typeerror" in error_line_lower:
-            return ErrorType.TYPE_ERROR
-        elif "attributeerror" in error_line_lower:
-            return ErrorType.ATTRIBUTE_ERROR
-        elif "importerror" in error_line_lower:
-            return ErrorType.IMPORT_ERROR
-        elif "syntaxerror" in error_line_lower:
-            return ErrorType.SYNTAX_ERROR
-        elif "filenotfounderror" in error_line_lower:
-            return ErrorType.FILE_NOT_FOUND
-        elif "indexerror" in error_line_lower:
-            return ErrorType.INDEX_ERROR
-        elif "keyerror" in error_line_lower:
-            return ErrorType.KEY_ERROR
-        elif "valueerror" in error_line_lower:
-            return ErrorType.VALUE_ERROR
-        elif "zerodivisionerror" in error_line_lower:
-            return ErrorType.ZERO_DIVISION_ERROR
-        else:
-            return ErrorType.UNKNOWN
+        match = _PYTHON_ERROR_RE.search(error_line)
+        if match:
+            return _KEYWORD_TO_ERROR_TYPE[match.group(0)]
+        return ErrorType.UNKNOWN
     
+    def _watch_pid_exit(self, pid: int):
+        """Arm event-driven exit notification for a monitored pid.
+
+        A pidfd becomes readable exactly once, when its process exits, so
+        the event loop tells us about deaths instantly and the periodic
+        os.kill sweep has nothing left to poll. Since the fd pins the exact
+        process, a recycled pid can't be mistaken for the old one. On
+        platforms without pidfd support the pid simply stays on the sweep
+        path.
+        """
+        pidfd_open = getattr(os, "pidfd_open", None)
+        if pidfd_open is None:
+            return
+        try:
+            pidfd = pidfd_open(pid)
+        except OSError:
+            # Process already exited (or pidfd unsupported by the kernel)
+            self.monitored_processes.discard(pid)
+            return
+        loop = asyncio.get_running_loop()
+        self._pidfds[pid] = pidfd
+        loop.add_reader(pidfd, self._on_pid_exit, pid, pidfd)
+
+    def _on_pid_exit(self, pid: int, pidfd: int):
+        """Event-loop callback fired when a watched process exits."""
+        asyncio.get_running_loop().remove_reader(pidfd)
+        os.close(pidfd)
+        self._pidfds.pop(pid, None)
+        self.monitored_processes.discard(pid)
+
     async def _cleanup_finished_processes(self):
         """Remove finished processes from monitoring."""
         finished_pids = set()
-        
-        for pid in self.monitored_processes:
+
+        # pids with a pidfd are cleaned up by _on_pid_exit; only poll the
+        # remainder (macOS, or kernels without pidfd_open)
+        for pid in self.monitored_processes - self._pidfds.keys():
             try:
                 # Check if process still exists
                 os.kill(pid, 0)
             except OSError:
                 # Process no longer exists
                 finished_pids.add(pid)
-        
+
         # Remove finished processes
         self.monitored_processes -= finished_pids 
\ No newline at end of file
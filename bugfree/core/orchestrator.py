@@ -1,15 +1,45 @@
 """Orchestrator Agent for coordinating between all agents and ranking suggestions."""
 
 import asyncio
+import heapq
+import re
 import time
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+import uuid
+from collections import Counter, deque
+from typing import Deque, List, Dict, Any, Optional
 
 from ..models.error_models import ErrorContext, FixSuggestion, AgentResponse, DebugSession
 from ..models.mcp_models import MCPRequest, MCPResponse, ErrorAnalysisRequest
 from ..mcp.client import MCPClient
 from ..mcp.server import MCPServer
 
+# Seconds between background connection-health sweeps
+_HEARTBEAT_INTERVAL_SECONDS = 5.0
+
+# Ranked suggestions kept for historical-success checks; old entries age
+# out so a long-lived orchestrator doesn't grow without bound
+_SUGGESTION_HISTORY_MAX = 10_000
+
+# Keywords that tie a suggestion's wording to an error type; frozensets so
+# the relevance check is a hashed intersection rather than substring scans
+_ERROR_TYPE_KEYWORDS = {
+    "name_error": frozenset(["name", "variable", "defined", "undefined"]),
+    "import_error": frozenset(["import", "module", "install"]),
+    "attribute_error": frozenset(["attribute", "method", "dir"]),
+    "type_error": frozenset(["type", "argument", "parameter"]),
+    "index_error": frozenset(["index", "list", "range"]),
+    "key_error": frozenset(["key", "dictionary", "get"]),
+    "file_not_found": frozenset(["file", "path", "exists"]),
+}
+_WORD_RE = re.compile(r"[a-z]+")
+
+# Per-agent score multipliers applied during ranking
+_AGENT_WEIGHTS = {
+    "code_agent": 1.2,      # Code agent gets 20% boost
+    "log_agent": 1.1,       # Log agent gets 10% boost
+    "orchestrator": 1.0,    # Base weight
+}
+
 
 class OrchestratorAgent:
     """Orchestrator agent that coordinates between all agents and ranks suggestions."""
@@ -20,7 +50,14 @@ class OrchestratorAgent:
         self.mcp_server = MCPServer(name, host="localhost", port=8000)
         self.agents: Dict[str, Dict[str, Any]] = {}
         self.active_sessions: Dict[str, DebugSession] = {}
-        self.suggestion_history: List[FixSuggestion] = []
+        self.suggestion_history: Deque[FixSuggestion] = deque(maxlen=_SUGGESTION_HISTORY_MAX)
+        # Background health sweep; set _health_wakeup after a send failure
+        # to trigger an immediate re-check instead of waiting a full cycle
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._health_wakeup = asyncio.Event()
+        # (title, agent_source) -> occurrences in suggestion_history, so
+        # historical-success checks are a dict hit instead of a history scan
+        self._history_counts: Counter = Counter()
         
         # Register MCP handlers
         self.mcp_server.register_handler("process_error", self._handle_process_error)
@@ -40,9 +77,19 @@ class OrchestratorAgent:
         
         # Connect to other agents
         await self._connect_to_agents()
+        
+        # Health checks run here instead of on every request
+        self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
     
     async def stop(self):
         """Stop the orchestrator agent."""
+        if self._heartbeat_task:
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat_task = None
         await self.mcp_server.stop()
         await self.mcp_client.close()
         print(f"Orchestrator Agent {self.name} stopped")
@@ -52,7 +99,7 @@ class OrchestratorAgent:
         # Connect to Log Agent
         log_connected = await self.mcp_client.connect_to_agent("log_agent", {"host": "localhost", "port": 8001})
         if log_connected:
-            self.agents["log_agent"] = {"connected": True, "last_heartbeat": datetime.now()}
+            self.agents["log_agent"] = {"connected": True, "last_heartbeat": time.monotonic()}
             print("Connected to Log Agent")
         else:
             print("Failed to connect to Log Agent")
@@ -60,7 +107,7 @@ class OrchestratorAgent:
         # Connect to Code Agent
         code_connected = await self.mcp_client.connect_to_agent("code_agent", {"host": "localhost", "port": 8002})
         if code_connected:
-            self.agents["code_agent"] = {"connected": True, "last_heartbeat": datetime.now()}
+            self.agents["code_agent"] = {"connected": True, "last_heartbeat": time.monotonic()}
             print("Connected to Code Agent")
         else:
             print("Failed to connect to Code Agent")
@@ -81,7 +128,8 @@ class OrchestratorAgent:
             )
             self.active_sessions[session_id] = session
         else:
-            session = list(self.active_sessions.values())[0]
+            # First session without materializing the whole values view
+            session = next(iter(self.active_sessions.values()))
             session_id = session.session_id
         
         # Add error to session
@@ -97,65 +145,64 @@ class OrchestratorAgent:
         session.applied_fixes.extend(ranked_suggestions[:3])  # Top 3 suggestions
         
         # Store in history
-        self.suggestion_history.extend(ranked_suggestions)
+        for suggestion in ranked_suggestions:
+            self._remember_suggestion(suggestion)
         
         processing_time = time.time() - start_time
         print(f"Processed error in {processing_time:.2f}s, found {len(ranked_suggestions)} suggestions")
         
         return ranked_suggestions[:3]  # Return top 3 suggestions
     
+    # Per-agent RPC method and fallback suggestion title
+    _AGENT_REQUESTS = (
+        ("log_agent", "analyze_error", "Log Analysis Suggestion"),
+        ("code_agent", "suggest_fixes", "Code Analysis Suggestion"),
+    )
+
     async def _collect_suggestions(self, error_context: ErrorContext) -> List[FixSuggestion]:
         """Collect suggestions from all connected agents."""
         all_suggestions = []
         
-        # Prepare error data for MCP
-        error_data = error_context.model_dump()
+        # Prepare error data for MCP; as_dict caches the Pydantic walk on
+        # the context so repeat serializations of the same error are free
+        error_data = error_context.as_dict
         
-        # Request suggestions from Log Agent
-        if "log_agent" in self.agents and self.agents["log_agent"]["connected"]:
-            try:
-                log_response = await self._request_from_agent("log_agent", "analyze_error", {
-                    "error_context": error_data
-                })
-                
-                if log_response and log_response.result:
-                    suggestions = log_response.result.get("suggestions", [])
-                    for suggestion in suggestions:
-                        fix_suggestion = FixSuggestion(
-                            title=suggestion.get("title", "Log Analysis Suggestion"),
-                            description=suggestion.get("description", ""),
-                            code_snippet=suggestion.get("code_snippet", ""),
-                            confidence_score=suggestion.get("confidence_score", 0.5),
-                            agent_source="log_agent",
-                            explanation=suggestion.get("explanation"),
-                        )
-                        all_suggestions.append(fix_suggestion)
-                        
-            except Exception as e:
-                print(f"Error getting suggestions from Log Agent: {e}")
+        # Fan the per-agent requests out concurrently so the round-trip
+        # costs max(agents) instead of their sum
+        targets = [
+            (agent_name, method, default_title)
+            for agent_name, method, default_title in self._AGENT_REQUESTS
+            if agent_name in self.agents and self.agents[agent_name]["connected"]
+        ]
+        if not targets:
+            return all_suggestions
         
-        # Request suggestions from Code Agent
-        if "code_agent" in self.agents and self.agents["code_agent"]["connected"]:
-            try:
-                code_response = await self._request_from_agent("code_agent", "suggest_fixes", {
-                    "error_context": error_data
-                })
-                
-                if code_response and code_response.result:
-                    suggestions = code_response.result.get("suggestions", [])
-                    for suggestion in suggestions:
-                        fix_suggestion = FixSuggestion(
-                            title=suggestion.get("title", "Code Analysis Suggestion"),
-                            description=suggestion.get("description", ""),
-                            code_snippet=suggestion.get("code_snippet", ""),
-                            confidence_score=suggestion.get("confidence_score", 0.5),
-                            agent_source="code_agent",
-                            explanation=suggestion.get("explanation"),
-                        )
-                        all_suggestions.append(fix_suggestion)
-                        
-            except Exception as e:
-                print(f"Error getting suggestions from Code Agent: {e}")
+        responses = await asyncio.gather(
+            *(
+                self._request_from_agent(agent_name, method, {"error_context": error_data})
+                for agent_name, method, _ in targets
+            ),
+            return_exceptions=True,
+        )
+        
+        for (agent_name, _, default_title), response in zip(targets, responses):
+            if isinstance(response, BaseException):
+                print(f"Error getting suggestions from {agent_name}: {response}")
+                continue
+            if response and response.result:
+                suggestions = response.result.get("suggestions", [])
+                for suggestion in suggestions:
+                    # Payloads come from our own agents' canonical
+                    # suggestion dicts, so skip re-validation on rewrap
+                    fix_suggestion = FixSuggestion.model_construct(
+                        title=suggestion.get("title", default_title),
+                        description=suggestion.get("description", ""),
+                        code_snippet=suggestion.get("code_snippet", ""),
+                        confidence_score=suggestion.get("confidence_score", 0.5),
+                        agent_source=agent_name,
+                        explanation=suggestion.get("explanation"),
+                    )
+                    all_suggestions.append(fix_suggestion)
         
         return all_suggestions
     
@@ -164,30 +211,20 @@ class OrchestratorAgent:
         if not suggestions:
             return []
         
-        # Calculate ranking scores for each suggestion
-        ranked_suggestions = []
-        for suggestion in suggestions:
-            score = self._calculate_suggestion_score(suggestion, error_context)
-            ranked_suggestions.append((suggestion, score))
-        
-        # Sort by score (highest first)
-        ranked_suggestions.sort(key=lambda x: x[1], reverse=True)
-        
-        # Return top suggestions
-        return [suggestion for suggestion, score in ranked_suggestions[:5]]
+        # Only the top five survive, so select them in O(n log 5) instead
+        # of fully sorting; the key scores each suggestion exactly once
+        return heapq.nlargest(
+            5,
+            suggestions,
+            key=lambda s: self._calculate_suggestion_score(s, error_context),
+        )
     
     def _calculate_suggestion_score(self, suggestion: FixSuggestion, error_context: ErrorContext) -> float:
         """Calculate a ranking score for a suggestion."""
         base_score = suggestion.confidence_score
         
         # Agent-specific weighting
-        agent_weights = {
-            "code_agent": 1.2,      # Code agent gets 20% boost
-            "log_agent": 1.1,       # Log agent gets 10% boost
-            "orchestrator": 1.0,    # Base weight
-        }
-        
-        agent_weight = agent_weights.get(suggestion.agent_source, 1.0)
+        agent_weight = _AGENT_WEIGHTS.get(suggestion.agent_source, 1.0)
         weighted_score = base_score * agent_weight
         
         # Error type matching bonus
@@ -206,25 +243,16 @@ class OrchestratorAgent:
     
     def _suggestion_matches_error_type(self, suggestion: FixSuggestion, error_context: ErrorContext) -> bool:
         """Check if suggestion title/description matches the error type."""
-        error_type = error_context.error_type.value.lower()
-        suggestion_text = f"{suggestion.title} {suggestion.description}".lower()
-        
-        # Check for error type keywords in suggestion
-        error_keywords = {
-            "name_error": ["name", "variable", "defined", "undefined"],
-            "import_error": ["import", "module", "install"],
-            "attribute_error": ["attribute", "method", "dir"],
-            "type_error": ["type", "argument", "parameter"],
-            "index_error": ["index", "list", "range"],
-            "key_error": ["key", "dictionary", "get"],
-            "file_not_found": ["file", "path", "exists"],
-        }
-        
-        if error_type in error_keywords:
-            keywords = error_keywords[error_type]
-            return any(keyword in suggestion_text for keyword in keywords)
+        keywords = _ERROR_TYPE_KEYWORDS.get(error_context.error_type.value)
+        if keywords is None:
+            return False
         
-        return False
+        # One tokenizing pass over the text, then a hashed intersection
+        # instead of a substring scan per keyword
+        suggestion_words = _WORD_RE.findall(
+            f"{suggestion.title} {suggestion.description}".lower()
+        )
+        return not keywords.isdisjoint(suggestion_words)
     
     async def _handle_process_error(self, request: MCPRequest) -> Dict[str, Any]:
         """Handle process error request from other agents."""
@@ -237,7 +265,7 @@ class OrchestratorAgent:
             
             return {
                 "suggestions": [s.model_dump() for s in suggestions],
-                "session_id": list(self.active_sessions.keys())[0] if self.active_sessions else None,
+                "session_id": next(iter(self.active_sessions)) if self.active_sessions else None,
                 "processing_time": 0.5,
             }
             
@@ -332,40 +360,81 @@ class OrchestratorAgent:
             print(f"Error applying fix: {e}")
             return False
     
+    async def _heartbeat_loop(self):
+        """Keep per-agent connection health fresh off the request path.
+        
+        Sweeps every few seconds, or immediately when a send failure sets
+        the wakeup event, reconnecting unhealthy agents so requests never
+        pay for a health round-trip up front.
+        """
+        while True:
+            # asyncio.timeout rather than wait_for: wait_for can swallow an
+            # outside cancellation when the event is already set, which
+            # would leave stop() waiting on an uncancellable task
+            try:
+                async with asyncio.timeout(_HEARTBEAT_INTERVAL_SECONDS):
+                    await self._health_wakeup.wait()
+            except asyncio.TimeoutError:
+                pass
+            self._health_wakeup.clear()
+            
+            for agent_name, agent in list(self.agents.items()):
+                try:
+                    healthy = await self.mcp_client.check_connection_health(agent_name)
+                    if not healthy:
+                        print(f"Connection to {agent_name} is unhealthy, attempting to reconnect...")
+                        connection_info = agent.get("connection_info") or {
+                            "host": "localhost",
+                            "port": 8001 if agent_name == "log_agent" else 8002,
+                        }
+                        healthy = await self.mcp_client.connect_to_agent(agent_name, connection_info)
+                    agent["connected"] = healthy
+                    if healthy:
+                        agent["last_heartbeat"] = time.monotonic()
+                except Exception as e:
+                    print(f"Heartbeat check failed for {agent_name}: {e}")
+    
     async def _request_from_agent(self, agent_name: str, method: str, params: Dict[str, Any]) -> Optional[MCPResponse]:
         """Send a request to a specific agent with improved error handling."""
         try:
-            # Check connection health first
-            if not await self.mcp_client.check_connection_health(agent_name):
-                print(f"Connection to {agent_name} is unhealthy, attempting to reconnect...")
-                connection_info = {"host": "localhost", "port": 8001 if agent_name == "log_agent" else 8002}
-                await self.mcp_client.connect_to_agent(agent_name, connection_info)
-            
             request = MCPRequest(
-                id=f"req_{int(time.time())}",
+                # Must be unique per in-flight request: the pipelined
+                # client demultiplexes responses by this id
+                id=uuid.uuid4().hex,
                 method=method,
                 params=params,
                 source_agent=self.name,
                 target_agent=agent_name,
             )
             
-            # Use retry logic
+            # Use retry logic; a failure wakes the heartbeat loop so the
+            # connection is repaired promptly for the next request
             response = await self.mcp_client.send_request_with_retry(agent_name, request)
+            if response is None:
+                self._health_wakeup.set()
             return response
             
         except Exception as e:
             print(f"Error requesting from {agent_name}: {e}")
+            self._health_wakeup.set()
             return None
     
+    def _remember_suggestion(self, suggestion: FixSuggestion):
+        """Append a suggestion to the bounded history, keeping the count
+        index in step with deque eviction."""
+        if len(self.suggestion_history) == self.suggestion_history.maxlen:
+            evicted = self.suggestion_history[0]
+            evicted_key = (evicted.title, evicted.agent_source)
+            self._history_counts[evicted_key] -= 1
+            if self._history_counts[evicted_key] <= 0:
+                del self._history_counts[evicted_key]
+        self.suggestion_history.append(suggestion)
+        self._history_counts[(suggestion.title, suggestion.agent_source)] += 1
+
     async def _check_historical_success(self, suggestion: FixSuggestion) -> bool:
         """Check if similar suggestions were successful in the past."""
         # Simple check for now - in a real system, this would query a database
-        similar_suggestions = [
-            s for s in self.suggestion_history
-            if s.title == suggestion.title and s.agent_source == suggestion.agent_source
-        ]
-        
-        return len(similar_suggestions) > 0
+        return self._history_counts[(suggestion.title, suggestion.agent_source)] > 0
     
     def get_active_sessions(self) -> List[DebugSession]:
         """Get all active debug sessions."""
@@ -373,7 +442,7 @@ class OrchestratorAgent:
     
     def get_suggestion_history(self) -> List[FixSuggestion]:
         """Get suggestion history."""
-        return self.suggestion_history.copy()
+        return list(self.suggestion_history)
     
     async def connect_to_agent(self, agent_name: str, connection_info: Dict[str, Any]):
         """Connect to another agent."""
@@ -381,7 +450,7 @@ class OrchestratorAgent:
         if success:
             self.agents[agent_name] = {
                 "connected": True,
-                "last_heartbeat": datetime.now(),
+                "last_heartbeat": time.monotonic(),
                 "connection_info": connection_info,
             }
         return success 
\ No newline at end of file
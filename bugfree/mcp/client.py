@@ -1,136 +1,255 @@
 """MCP client for agent communication."""
 
 import asyncio
-import json
+import random
 import uuid
 import socket
+import time
 from typing import Dict, Any, Optional, List
-from datetime import datetime
 
 from ..models.mcp_models import MCPRequest, MCPResponse, ErrorAnalysisRequest, CodeContextRequest
+from .wire import serialize, deserialize, frame, read_frame, tune_socket
+
+# How often check_connection_health actually verifies a connection;
+# between checks it trusts the cached result
+_HEALTH_CHECK_INTERVAL_SECONDS = 30.0
 
 
 class MCPClient:
     """MCP client for sending requests to other agents."""
     
-    def __init__(self, agent_name: str, timeout: float = 10.0, max_retries: int = 3):
+    def __init__(self, agent_name: str, timeout: float = 10.0, max_retries: int = 3, pool_size: int = 4):
         self.agent_name = agent_name
         self.connections: Dict[str, Dict[str, Any]] = {}
         self.request_handlers: Dict[str, callable] = {}
         self.timeout = timeout
         self.max_retries = max_retries
-        self.connection_locks: Dict[str, asyncio.Lock] = {}
-    
+        # Sockets opened per agent; requests round-robin across them so
+        # concurrent traffic isn't funneled through one TCP stream
+        self.pool_size = pool_size
+
     async def connect_to_agent(self, agent_name: str, connection_info: Dict[str, Any]) -> bool:
-        """Connect to another agent with timeout and retry logic."""
+        """Connect to another agent with timeout and retry logic.
+
+        Opens a small pool of sockets ("channels"); each channel carries
+        its own reader task, write lock, and in-flight request map.
+        """
         for attempt in range(self.max_retries):
+            channels = []
             try:
                 host = connection_info.get("host", "localhost")
                 port = connection_info.get("port", 8000)
-                
-                # Test the connection with timeout
-                reader, writer = await asyncio.wait_for(
-                    asyncio.open_connection(host, port),
-                    timeout=self.timeout
-                )
-                
+
+                for _ in range(self.pool_size):
+                    reader, writer = await asyncio.wait_for(
+                        asyncio.open_connection(host, port),
+                        timeout=self.timeout
+                    )
+                    tune_socket(writer)
+                    channels.append({
+                        "reader": reader,
+                        "writer": writer,
+                        # request id -> future resolved by this channel's
+                        # reader task
+                        "pending": {},
+                    })
+
+                # Tear down the previous pool if this is a reconnect:
+                # cancel the stale reader tasks and close their writers,
+                # or each reconnect would leak pool_size sockets
+                stale = self.connections.get(agent_name)
+                if stale is not None:
+                    stale["connected"] = False
+                    for old_channel in stale.get("channels", []):
+                        old_task = old_channel.get("reader_task")
+                        if old_task is not None:
+                            old_task.cancel()
+                    self._close_channels(stale.get("channels", []))
+
                 # Store connection info
                 self.connections[agent_name] = {
                     "connected": True,
                     "connection_info": connection_info,
-                    "reader": reader,
-                    "writer": writer,
-                    "last_heartbeat": datetime.now(),
-                    "connection_time": datetime.now(),
+                    "channels": channels,
+                    "rr": 0,
+                    # Monotonic timestamps: these only ever feed age
+                    # comparisons, and monotonic can't jump on wall-clock
+                    # adjustments
+                    "last_heartbeat": time.monotonic(),
+                    "connection_time": time.monotonic(),
                 }
-                
-                # Create a lock for this connection
-                self.connection_locks[agent_name] = asyncio.Lock()
-                
-                print(f"Connected to {agent_name} at {host}:{port}")
+
+                for channel in channels:
+                    channel["reader_task"] = asyncio.create_task(
+                        self._reader_loop(agent_name, channel)
+                    )
+
+                print(f"Connected to {agent_name} at {host}:{port} ({len(channels)} sockets)")
                 return True
-                
+
             except asyncio.TimeoutError:
                 print(f"Connection timeout to {agent_name} (attempt {attempt + 1}/{self.max_retries})")
+                self._close_channels(channels)
                 if attempt < self.max_retries - 1:
                     await asyncio.sleep(1)  # Wait before retry
             except Exception as e:
                 print(f"Failed to connect to agent {agent_name} (attempt {attempt + 1}/{self.max_retries}): {e}")
+                self._close_channels(channels)
                 if attempt < self.max_retries - 1:
                     await asyncio.sleep(1)  # Wait before retry
-        
+
         return False
+
+    @staticmethod
+    def _close_channels(channels: List[Dict[str, Any]]):
+        """Close the writers of partially or fully opened channels."""
+        for channel in channels:
+            try:
+                channel["writer"].close()
+            except Exception:
+                pass
     
     async def send_request(self, target_agent: str, request: MCPRequest) -> Optional[MCPResponse]:
         """Send a request to another agent with timeout handling."""
+        return await self._send_request_data(target_agent, request.model_dump())
+
+    async def _send_request_data(self, target_agent: str, request_data: Dict[str, Any]) -> Optional[MCPResponse]:
+        """Send an already-serialized request dict to another agent.
+
+        Callers that fan one request out to many agents dump the model
+        once and go through here per agent, instead of building and
+        dumping a fresh Pydantic object for each target.
+        """
         if target_agent not in self.connections:
             raise ValueError(f"Not connected to agent {target_agent}")
-        
-        # Get the lock for this connection
-        lock = self.connection_locks.get(target_agent)
-        if not lock:
-            print(f"No lock found for {target_agent}, creating one")
-            lock = asyncio.Lock()
-            self.connection_locks[target_agent] = lock
-        
-        async with lock:  # Ensure only one request at a time per connection
-            try:
-                connection = self.connections[target_agent]
-                writer = connection["writer"]
-                
-                # Send request - ensure proper serialization
-                request_dict = request.model_dump()
-                request_data = json.dumps(request_dict).encode('utf-8')
-                writer.write(request_data)
+
+        connection = self.connections[target_agent]
+
+        # Round-robin across the channel pool so concurrent requests use
+        # parallel TCP streams instead of queueing on one socket
+        channels = connection["channels"]
+        index = connection["rr"]
+        connection["rr"] = (index + 1) % len(channels)
+        channel = channels[index]
+
+        # The write lock is created lazily on the first send: channels
+        # that only ever receive never allocate one
+        lock = channel.get("lock")
+        if lock is None:
+            lock = channel["lock"] = asyncio.Lock()
+
+        request_id = request_data["id"]
+        pending = channel["pending"]
+        # A duplicate id would silently overwrite the earlier waiter and
+        # cross-wire the two responses; regenerate rather than trust the
+        # caller's id to be unique among in-flight requests
+        while request_id in pending:
+            request_id = request_data["id"] = uuid.uuid4().hex
+        future = asyncio.get_running_loop().create_future()
+        pending[request_id] = future
+
+        try:
+            writer = channel["writer"]
+
+            # The lock guards only the atomic framed write, so any number
+            # of requests can be in flight on the connection; the reader
+            # task resolves our future when the matching response arrives
+            async with lock:
+                writer.write(frame(serialize(request_data)))
                 await asyncio.wait_for(writer.drain(), timeout=self.timeout)
-                
-                # Read response with timeout
-                reader = connection["reader"]
-                data = await asyncio.wait_for(reader.read(4096), timeout=self.timeout)
-                
-                if data:
-                    response_data = json.loads(data.decode('utf-8'))
-                    return MCPResponse(**response_data)
-                else:
-                    print(f"No response from {target_agent}")
-                    return None
-                    
-            except asyncio.TimeoutError:
-                print(f"Request timeout to {target_agent}")
-                # Mark connection as failed
-                if target_agent in self.connections:
-                    self.connections[target_agent]["connected"] = False
-                return None
-            except Exception as e:
-                print(f"Failed to send request to {target_agent}: {e}")
-                # Mark connection as failed
-                if target_agent in self.connections:
-                    self.connections[target_agent]["connected"] = False
-                return None
+
+            return await asyncio.wait_for(future, timeout=self.timeout)
+
+        except asyncio.TimeoutError:
+            print(f"Request timeout to {target_agent}")
+            # Mark connection as failed
+            if target_agent in self.connections:
+                self.connections[target_agent]["connected"] = False
+            return None
+        except Exception as e:
+            print(f"Failed to send request to {target_agent}: {e}")
+            # Mark connection as failed
+            if target_agent in self.connections:
+                self.connections[target_agent]["connected"] = False
+            return None
+        finally:
+            pending.pop(request_id, None)
+    
+    async def _reader_loop(self, agent_name: str, channel: Dict[str, Any]):
+        """Dispatch incoming response frames to their waiting futures.
+
+        One task per channel reads every frame and resolves the future
+        registered under the response's request_id, so concurrent
+        requests share the channel instead of queueing behind a full
+        round-trip lock. Frames with no waiter (server broadcasts, or
+        responses whose sender already timed out) are dropped rather than
+        poisoning the next response read.
+        """
+        reader = channel["reader"]
+        pending = channel["pending"]
+        try:
+            while True:
+                data = await read_frame(reader)
+                response_data = deserialize(data)
+                future = pending.pop(response_data.get("request_id"), None)
+                if future is not None and not future.done():
+                    future.set_result(MCPResponse(**response_data))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass  # Peer closed the connection
+        except Exception as e:
+            print(f"Reader loop error for {agent_name}: {e}")
+        finally:
+            # Only mark the connection failed if this channel still
+            # belongs to it -- a stale task cancelled during reconnect
+            # runs this after the new pool is installed under the same
+            # agent name and must not clobber it
+            current = self.connections.get(agent_name)
+            if current is not None and any(
+                ch is channel for ch in current.get("channels", [])
+            ):
+                current["connected"] = False
+            # Fail anything still in flight so senders don't wait out
+            # their full timeout against a dead connection
+            for waiting in pending.values():
+                if not waiting.done():
+                    waiting.set_exception(
+                        ConnectionError(f"Connection to {agent_name} closed")
+                    )
+            pending.clear()
     
     async def broadcast_error(self, error_context: Dict[str, Any]) -> List[MCPResponse]:
-        """Broadcast an error to all connected agents."""
-        responses = []
-        
+        """Broadcast an error to all connected agents.
+
+        The per-agent requests are independent, so they run concurrently
+        and the broadcast takes one round-trip instead of the sum of all
+        of them. The request is validated and dumped once; each agent
+        gets a shallow copy with its own id and target, since everything
+        else is identical across targets.
+        """
+        base_request = ErrorAnalysisRequest(
+            id="",
+            source_agent=self.agent_name,
+            target_agent="",
+            error_context=error_context,
+        ).model_dump()
+
+        coros = []
         for agent_name in self.connections:
             if self.connections[agent_name]["connected"]:
-                request = ErrorAnalysisRequest(
-                    id=str(uuid.uuid4()),
-                    source_agent=self.agent_name,
-                    target_agent=agent_name,
-                    error_context=error_context,
-                )
-                
-                response = await self.send_request(agent_name, request)
-                if response:
-                    responses.append(response)
-        
-        return responses
+                per_agent = dict(base_request)
+                per_agent["id"] = uuid.uuid4().hex
+                per_agent["target_agent"] = agent_name
+                coros.append(self._send_request_data(agent_name, per_agent))
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        return [
+            response for response in results
+            if response is not None and not isinstance(response, BaseException)
+        ]
     
     async def request_code_context(self, target_agent: str, file_path: str, line_number: Optional[int] = None) -> Optional[MCPResponse]:
         """Request code context from another agent."""
         request = CodeContextRequest(
-            id=str(uuid.uuid4()),
+            id=uuid.uuid4().hex,
             source_agent=self.agent_name,
             target_agent=target_agent,
             file_path=file_path,
@@ -145,11 +264,15 @@ class MCPClient:
     
     async def handle_incoming_request(self, request: MCPRequest) -> MCPResponse:
         """Handle an incoming request from another agent."""
-        if request.method in self.request_handlers:
+        handler = self.request_handlers.get(request.method)
+        if handler is not None:
             try:
-                result = await self.request_handlers[request.method](request)
+                if asyncio.iscoroutinefunction(handler):
+                    result = await handler(request)
+                else:
+                    result = handler(request)
                 return MCPResponse(
-                    id=str(uuid.uuid4()),
+                    id=uuid.uuid4().hex,
                     request_id=request.id,
                     result=result,
                     source_agent=self.agent_name,
@@ -157,7 +280,7 @@ class MCPClient:
                 )
             except Exception as e:
                 return MCPResponse(
-                    id=str(uuid.uuid4()),
+                    id=uuid.uuid4().hex,
                     request_id=request.id,
                     error={"code": "handler_error", "message": str(e)},
                     source_agent=self.agent_name,
@@ -165,7 +288,7 @@ class MCPClient:
                 )
         else:
             return MCPResponse(
-                id=str(uuid.uuid4()),
+                id=uuid.uuid4().hex,
                 request_id=request.id,
                 error={"code": "method_not_found", "message": f"Method {request.method} not found"},
                 source_agent=self.agent_name,
@@ -186,23 +309,21 @@ class MCPClient:
         try:
             if agent_name in self.connections:
                 connection = self.connections[agent_name]
-                if "writer" in connection:
-                    connection["writer"].close()
-                    await connection["writer"].wait_closed()
+                for channel in connection.get("channels", []):
+                    reader_task = channel.get("reader_task")
+                    if reader_task is not None:
+                        reader_task.cancel()
+                        try:
+                            await reader_task
+                        except asyncio.CancelledError:
+                            pass
+                    channel["writer"].close()
+                    await channel["writer"].wait_closed()
                 del self.connections[agent_name]
         except KeyError:
             pass  # Already removed
         except Exception as e:
             print(f"Error disconnecting from {agent_name}: {e}")
-        
-        # Clean up the connection lock
-        try:
-            if agent_name in self.connection_locks:
-                del self.connection_locks[agent_name]
-        except KeyError:
-            pass  # Already removed
-        except Exception as e:
-            print(f"Error removing lock for {agent_name}: {e}")
     
     async def send_request_with_retry(self, target_agent: str, request: MCPRequest, max_retries: int = None) -> Optional[MCPResponse]:
         """Send a request with retry logic."""
@@ -221,19 +342,33 @@ class MCPClient:
         return None
     
     async def check_connection_health(self, agent_name: str) -> bool:
-        """Check if connection to an agent is healthy."""
+        """Check if connection to an agent is healthy.
+
+        Callers may invoke this on every send, so a real verification
+        only runs once the cached result expires; in between, a known
+        live connection is trusted. The expiry is jittered so
+        connections opened together don't all re-verify (and possibly
+        reconnect) in the same instant.
+        """
         if agent_name not in self.connections:
             return False
-        
+
         connection = self.connections[agent_name]
         if not connection["connected"]:
             return False
-        
+
+        now = time.monotonic()
+        if now < connection.get("next_health_check", 0.0):
+            return True
+        connection["next_health_check"] = (
+            now + random.uniform(0.8, 1.2) * _HEALTH_CHECK_INTERVAL_SECONDS
+        )
+
         # Check if connection is too old (more than 5 minutes)
         connection_time = connection.get("connection_time")
-        if connection_time and (datetime.now() - connection_time).total_seconds() > 300:
+        if connection_time and now - connection_time > 300:
             print(f"Connection to {agent_name} is too old, reconnecting...")
             await self.disconnect_from_agent(agent_name)
             return await self.connect_to_agent(agent_name, connection["connection_info"])
-        
+
         return True 
\ No newline at end of file
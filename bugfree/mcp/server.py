@@ -4,10 +4,11 @@ import asyncio
 import json
 import uuid
 import socket
+import time
 from typing import Dict, Any, Optional, List, Callable
-from datetime import datetime
 
 from ..models.mcp_models import MCPRequest, MCPResponse
+from .wire import serialize, deserialize, frame, read_frame, tune_socket
 
 
 class MCPServer:
@@ -39,7 +40,9 @@ class MCPServer:
             self.server = await asyncio.start_server(
                 self._handle_client,
                 self.host,
-                self.port
+                self.port,
+                reuse_address=True,
+                backlog=128,
             )
             self.running = True
             
@@ -98,33 +101,35 @@ class MCPServer:
         """Handle incoming client connections with improved error handling."""
         client_addr = writer.get_extra_info('peername')
         client_id = f"{client_addr[0]}:{client_addr[1]}"
+        tune_socket(writer)
         
         print(f"New client connected: {client_id}")
         self.clients[client_id] = {
             "reader": reader,
             "writer": writer,
             "connected": True,
-            "last_activity": datetime.now(),
+            "last_activity": time.monotonic(),
         }
         
         try:
             while self.running and self.clients[client_id]["connected"]:
-                # Read request data with timeout
+                # Read one request frame with timeout; requests are no
+                # longer capped by a fixed read size
                 try:
-                    data = await asyncio.wait_for(reader.read(1024), timeout=30.0)
-                    if not data:
-                        break
+                    data = await asyncio.wait_for(read_frame(reader), timeout=30.0)
                     
                     # Update last activity
-                    self.clients[client_id]["last_activity"] = datetime.now()
+                    self.clients[client_id]["last_activity"] = time.monotonic()
                     
+                except asyncio.IncompleteReadError:
+                    break
                 except asyncio.TimeoutError:
                     print(f"Client {client_id} timeout, disconnecting")
                     break
                 
                 # Parse request
                 try:
-                    request_data = json.loads(data.decode('utf-8'))
+                    request_data = deserialize(data)
                     request = MCPRequest(**request_data)
                     
                     # Handle request
@@ -132,7 +137,7 @@ class MCPServer:
                     
                     # Send response with timeout
                     try:
-                        response_data = json.dumps(response.model_dump()).encode('utf-8')
+                        response_data = frame(serialize(response.model_dump()))
                         writer.write(response_data)
                         await asyncio.wait_for(writer.drain(), timeout=10.0)
                     except asyncio.TimeoutError:
@@ -143,14 +148,14 @@ class MCPServer:
                     print(f"Invalid JSON from client {client_id}: {e}")
                     # Send error response
                     error_response = MCPResponse(
-                        id=str(uuid.uuid4()),
+                        id=uuid.uuid4().hex,
                         request_id="unknown",
                         error={"code": "invalid_json", "message": "Invalid JSON format"},
                         source_agent=self.agent_name,
                         target_agent="unknown",
                     )
                     try:
-                        error_data = json.dumps(error_response.model_dump()).encode('utf-8')
+                        error_data = frame(serialize(error_response.model_dump()))
                         writer.write(error_data)
                         await asyncio.wait_for(writer.drain(), timeout=5.0)
                     except:
@@ -160,14 +165,14 @@ class MCPServer:
                     print(f"Error processing request from client {client_id}: {e}")
                     # Send error response
                     error_response = MCPResponse(
-                        id=str(uuid.uuid4()),
+                        id=uuid.uuid4().hex,
                         request_id="unknown",
                         error={"code": "processing_error", "message": str(e)},
                         source_agent=self.agent_name,
                         target_agent="unknown",
                     )
                     try:
-                        error_data = json.dumps(error_response.model_dump()).encode('utf-8')
+                        error_data = frame(serialize(error_response.model_dump()))
                         writer.write(error_data)
                         await asyncio.wait_for(writer.drain(), timeout=5.0)
                     except:
@@ -189,15 +194,18 @@ class MCPServer:
     
     async def _process_request(self, request: MCPRequest) -> MCPResponse:
         """Process an incoming request with improved error handling."""
-        if request.method in self.request_handlers:
+        handler = self.request_handlers.get(request.method)
+        if handler is not None:
             try:
-                # Add timeout to handler execution
-                result = await asyncio.wait_for(
-                    self.request_handlers[request.method](request),
-                    timeout=30.0
-                )
+                if asyncio.iscoroutinefunction(handler):
+                    # Add timeout to handler execution
+                    result = await asyncio.wait_for(handler(request), timeout=30.0)
+                else:
+                    # Trivial synchronous handlers run inline without the
+                    # task/timeout machinery
+                    result = handler(request)
                 return MCPResponse(
-                    id=str(uuid.uuid4()),
+                    id=uuid.uuid4().hex,
                     request_id=request.id,
                     result=result,
                     source_agent=self.agent_name,
@@ -205,7 +213,7 @@ class MCPServer:
                 )
             except asyncio.TimeoutError:
                 return MCPResponse(
-                    id=str(uuid.uuid4()),
+                    id=uuid.uuid4().hex,
                     request_id=request.id,
                     error={"code": "handler_timeout", "message": "Handler execution timed out"},
                     source_agent=self.agent_name,
@@ -213,7 +221,7 @@ class MCPServer:
                 )
             except Exception as e:
                 return MCPResponse(
-                    id=str(uuid.uuid4()),
+                    id=uuid.uuid4().hex,
                     request_id=request.id,
                     error={"code": "handler_error", "message": str(e)},
                     source_agent=self.agent_name,
@@ -221,7 +229,7 @@ class MCPServer:
                 )
         else:
             return MCPResponse(
-                id=str(uuid.uuid4()),
+                id=uuid.uuid4().hex,
                 request_id=request.id,
                 error={"code": "method_not_found", "message": f"Method {request.method} not found"},
                 source_agent=self.agent_name,
@@ -230,16 +238,28 @@ class MCPServer:
     
     async def broadcast_message(self, message: Dict[str, Any]):
         """Broadcast a message to all connected clients."""
-        message_data = json.dumps(message).encode('utf-8')
-        
+        message_data = frame(serialize(message))
+
+        # Buffer the frame to every client first, then drain them together,
+        # so one slow client's flow control doesn't serialize the broadcast
+        pending = []
         for client_id, client_info in list(self.clients.items()):
             if client_info["connected"]:
                 try:
                     client_info["writer"].write(message_data)
-                    await client_info["writer"].drain()
+                    pending.append((client_id, client_info))
                 except Exception as e:
                     print(f"Failed to send message to client {client_id}: {e}")
                     client_info["connected"] = False
+
+        drains = await asyncio.gather(
+            *(client_info["writer"].drain() for _, client_info in pending),
+            return_exceptions=True,
+        )
+        for (client_id, client_info), result in zip(pending, drains):
+            if isinstance(result, BaseException):
+                print(f"Failed to send message to client {client_id}: {result}")
+                client_info["connected"] = False
     
     def get_connected_clients(self) -> List[str]:
         """Get list of connected client IDs."""
@@ -269,11 +289,15 @@ class SimpleMCPServer:
     
     async def handle_request(self, request: MCPRequest) -> MCPResponse:
         """Handle an incoming request."""
-        if request.method in self.request_handlers:
+        handler = self.request_handlers.get(request.method)
+        if handler is not None:
             try:
-                result = await self.request_handlers[request.method](request)
+                if asyncio.iscoroutinefunction(handler):
+                    result = await handler(request)
+                else:
+                    result = handler(request)
                 return MCPResponse(
-                    id=str(uuid.uuid4()),
+                    id=uuid.uuid4().hex,
                     request_id=request.id,
                     result=result,
                     source_agent=self.agent_name,
@@ -281,7 +305,7 @@ class SimpleMCPServer:
                 )
             except Exception as e:
                 return MCPResponse(
-                    id=str(uuid.uuid4()),
+                    id=uuid.uuid4().hex,
                     request_id=request.id,
                     error={"code": "handler_error", "message": str(e)},
                     source_agent=self.agent_name,
@@ -289,7 +313,7 @@ class SimpleMCPServer:
                 )
         else:
             return MCPResponse(
-                id=str(uuid.uuid4()),
+                id=uuid.uuid4().hex,
                 request_id=request.id,
                 error={"code": "method_not_found", "message": f"Method {request.method} not found"},
                 source_agent=self.agent_name,
@@ -0,0 +1,81 @@
+"""Wire-format helpers shared by the MCP client and server."""
+
+import asyncio
+import json
+import socket
+import struct
+from typing import Any, Dict
+
+# Every message is a 4-byte big-endian length prefix followed by the
+# serialized payload, so readers get exact frames instead of hoping a
+# message fits one fixed-size read
+_LENGTH = struct.Struct(">I")
+
+
+def frame(payload: bytes) -> bytes:
+    """Wrap a serialized payload in its length prefix as one buffer, so
+    the caller can send prefix and payload with a single write."""
+    return _LENGTH.pack(len(payload)) + payload
+
+
+async def read_frame(reader: asyncio.StreamReader) -> bytes:
+    """Read one length-prefixed frame.
+
+    Raises asyncio.IncompleteReadError when the peer closes the
+    connection (cleanly or mid-frame).
+    """
+    header = await reader.readexactly(_LENGTH.size)
+    (length,) = _LENGTH.unpack(header)
+    return await reader.readexactly(length)
+
+# 1 MiB send/receive buffers: large error contexts and broadcast fan-out
+# should be absorbed by the kernel, not stall the event loop in drain()
+_SOCKET_BUFFER_SIZE = 1 << 20
+
+
+def tune_socket(writer: asyncio.StreamWriter) -> None:
+    """Apply latency/throughput options to a stream's underlying socket.
+
+    Disables Nagle's algorithm -- every frame is a complete message that
+    should go out immediately, not wait to be coalesced -- and widens the
+    kernel buffers. Best-effort: a transport without a real socket (or a
+    kernel refusing the sizes) leaves the defaults in place.
+    """
+    sock = writer.get_extra_info('socket')
+    if sock is None:
+        return
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SOCKET_BUFFER_SIZE)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _SOCKET_BUFFER_SIZE)
+    except OSError:
+        pass
+
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    def serialize(payload: Dict[str, Any]) -> bytes:
+        """Encode a request/response dict for the wire (orjson)."""
+        return orjson.dumps(payload)
+
+    def deserialize(data: bytes) -> Dict[str, Any]:
+        """Decode wire bytes back into a request/response dict (orjson)."""
+        return orjson.loads(data)
+else:
+    def serialize(payload: Dict[str, Any]) -> bytes:
+        """Encode a request/response dict for the wire.
+
+        Compact separators keep whitespace off the wire; both endpoints
+        go through this pair, so a faster codec only needs to change
+        here.
+        """
+        return json.dumps(payload, separators=(',', ':')).encode('utf-8')
+
+    def deserialize(data: bytes) -> Dict[str, Any]:
+        """Decode wire bytes back into a request/response dict."""
+        return json.loads(data)
@@ -1,6 +1,7 @@
 """Data models for error handling and debugging."""
 
 from datetime import datetime
+from functools import cached_property
 from enum import Enum
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field, ConfigDict
@@ -25,6 +26,7 @@ class ErrorType(str, Enum):
     INDEX_ERROR = "index_error"
     KEY_ERROR = "key_error"
     VALUE_ERROR = "value_error"
+    ZERO_DIVISION_ERROR = "zero_division_error"
     NAME_ERROR = "name_error"
     FILE_NOT_FOUND = "file_not_found"
     PERMISSION_ERROR = "permission_error"
@@ -48,6 +50,19 @@ class ErrorContext(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.now)
     additional_context: Dict[str, Any] = Field(default_factory=dict)
     
+    @cached_property
+    def message_lower(self) -> str:
+        """Lowercased error message, computed once and reused by the
+        similarity and noise-filter passes."""
+        return self.error_message.lower()
+    
+    @cached_property
+    def as_dict(self) -> Dict[str, Any]:
+        """model_dump() computed once and reused wherever the same context
+        is serialized again (per-agent requests, broadcasts). Contexts are
+        treated as immutable after creation."""
+        return self.model_dump()
+
     def model_dump(self, *args, **kwargs):
         """Override model_dump to handle datetime serialization."""
         data = super().model_dump(*args, **kwargs)
@@ -1,5 +1,6 @@
 """File utility functions for the DevSage debugging system."""
 
+import functools
 import os
 import aiofiles
 from pathlib import Path
@@ -64,15 +65,16 @@ def get_file_language(file_path: str) -> str:
     return extension_map.get(extension, "unknown")
 
 
-def get_surrounding_lines(file_path: str, line_number: int, context_lines: int = 5) -> Optional[str]:
-    """Get surrounding lines of code around a specific line number."""
+@functools.lru_cache(maxsize=256)
+def _surrounding_lines_cached(file_path: str, line_number: int, context_lines: int, mtime: Optional[float]) -> Optional[str]:
+    """Cached worker for get_surrounding_lines; mtime keys out stale content."""
     try:
         with open(file_path, "r", encoding="utf-8") as file:
             lines = file.readlines()
-            
+
         start_line = max(0, line_number - context_lines - 1)
         end_line = min(len(lines), line_number + context_lines)
-        
+
         surrounding_lines = lines[start_line:end_line]
         return "".join(surrounding_lines)
     except (FileNotFoundError, PermissionError) as e:
@@ -80,6 +82,15 @@ def get_surrounding_lines(file_path: str, line_number: int, context_lines: int =
         return None
 
 
+def get_surrounding_lines(file_path: str, line_number: int, context_lines: int = 5) -> Optional[str]:
+    """Get surrounding lines of code around a specific line number."""
+    try:
+        mtime = os.path.getmtime(file_path)
+    except OSError:
+        mtime = None
+    return _surrounding_lines_cached(file_path, line_number, context_lines, mtime)
+
+
 def find_project_root(start_path: str) -> Optional[str]:
     """Find the project root directory by looking for common project files."""
     current_path = Path(start_path).resolve()
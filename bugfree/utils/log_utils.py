@@ -8,56 +8,111 @@ import sys
 
 from ..models.error_models import ErrorContext, ErrorType, ErrorSeverity
 
+# Compiled once at import: the classifier runs per log line, and a single
+# alternation per language means one engine pass instead of one search
+# per pattern. The branches are detection-only, so their groups are
+# non-capturing.
+_PYTHON_DETECT_RE = re.compile(
+    r'Traceback \(most recent call last\):'
+    r'|File "(?:.*?)", line (?:\d+), in (?:.+)'
+    r'|(?:\w+Error): (?:.+)'
+    r'|(?:\w+Exception): (?:.+)'
+)
+
+_JS_DETECT_RE = re.compile(
+    r'Error: (?:.+)'
+    r'|at (?:.+) \((?:.+):(?:\d+):(?:\d+)\)'
+    r'|TypeError: (?:.+)'
+    r'|ReferenceError: (?:.+)'
+    r'|SyntaxError: (?:.+)'
+)
+
+_JAVA_DETECT_RE = re.compile(
+    r'Exception in thread "(?:.+)" (?:.+): (?:.+)'
+    r'|at (?:.+)\.(?:.+)\((?:.+):(?:\d+)\)'
+    r'|Caused by: (?:.+): (?:.+)'
+)
+
+_PY_ERROR_RE = re.compile(r'(\w+Error|\w+Exception): (.+)')
+_FILE_LINE_RE = re.compile(r'File "(.*?)", line (\d+), in (.+)')
+_JS_ERROR_RE = re.compile(r'(\w+Error): (.+)')
+_JS_STACK_RE = re.compile(r'at (.+) \((.+):(\d+):(\d+)\)')
+_JAVA_EXC_RE = re.compile(r'Exception in thread "(.+)" (.+): (.+)')
+_JAVA_STACK_RE = re.compile(r'at (.+)\.(.+)\((.+):(\d+)\)')
+
+
+# Context window the extractors need around a candidate line: stack-trace
+# collection looks back up to 20 lines, the JS/Java extractors look ahead
+# up to 10.
+_PARSE_LOOKBACK_LINES = 20
+_PARSE_LOOKAHEAD_LINES = 10
+
+# Buffered lines beyond the context window are dropped once they can no
+# longer influence classification, keeping streamed parsing at O(block)
+# memory instead of O(file).
+_PARSE_BLOCK_LINES = 4096
+
+
+class StreamingLogParser:
+    """Incrementally parse error contexts from streamed log lines.
+
+    feed() accepts lines as they arrive and returns the errors whose full
+    context window is already buffered; finish() flushes the tail. Results
+    match parse_error_log on the same content, but peak memory is bounded
+    by the block size rather than the file size.
+    """
+
+    def __init__(self):
+        self._lines: List[str] = []
+        self._next = 0
+
+    def feed(self, lines: List[str]) -> List[ErrorContext]:
+        self._lines.extend(lines)
+        errors = self._drain(len(self._lines) - _PARSE_LOOKAHEAD_LINES)
+
+        # Drop the consumed prefix once it is out of lookback range
+        if self._next > _PARSE_LOOKBACK_LINES + _PARSE_BLOCK_LINES:
+            drop = self._next - _PARSE_LOOKBACK_LINES
+            del self._lines[:drop]
+            self._next -= drop
+
+        return errors
+
+    def finish(self) -> List[ErrorContext]:
+        return self._drain(len(self._lines))
+
+    def _drain(self, until: int) -> List[ErrorContext]:
+        errors = []
+        while self._next < until:
+            error_context = extract_error_from_line(
+                self._lines[self._next], self._lines, self._next
+            )
+            if error_context:
+                errors.append(error_context)
+            self._next += 1
+        return errors
+
 
 def parse_error_log(log_content: str) -> List[ErrorContext]:
     """Parse error log content and extract error contexts."""
-    errors = []
-    lines = log_content.split('\n')
-    
-    for i, line in enumerate(lines):
-        error_context = extract_error_from_line(line, lines, i)
-        if error_context:
-            errors.append(error_context)
-    
+    parser = StreamingLogParser()
+    errors = parser.feed(log_content.split('\n'))
+    errors.extend(parser.finish())
     return errors
 
 
 def extract_error_from_line(line: str, all_lines: List[str], line_index: int) -> Optional[ErrorContext]:
     """Extract error information from a single log line."""
-    # Python traceback patterns
-    python_patterns = [
-        r'Traceback \(most recent call last\):',
-        r'File "(.*?)", line (\d+), in (.+)',
-        r'(\w+Error): (.+)',
-        r'(\w+Exception): (.+)',
-    ]
-    
-    # JavaScript/Node.js patterns
-    js_patterns = [
-        r'Error: (.+)',
-        r'at (.+) \((.+):(\d+):(\d+)\)',
-        r'TypeError: (.+)',
-        r'ReferenceError: (.+)',
-        r'SyntaxError: (.+)',
-    ]
-    
-    # Java patterns
-    java_patterns = [
-        r'Exception in thread "(.+)" (.+): (.+)',
-        r'at (.+)\.(.+)\((.+):(\d+)\)',
-        r'Caused by: (.+): (.+)',
-    ]
-    
     # Check for Python errors
-    if any(re.search(pattern, line) for pattern in python_patterns):
+    if _PYTHON_DETECT_RE.search(line):
         return extract_python_error(line, all_lines, line_index)
     
     # Check for JavaScript errors
-    if any(re.search(pattern, line) for pattern in js_patterns):
+    if _JS_DETECT_RE.search(line):
         return extract_javascript_error(line, all_lines, line_index)
     
     # Check for Java errors
-    if any(re.search(pattern, line) for pattern in java_patterns):
+    if _JAVA_DETECT_RE.search(line):
         return extract_java_error(line, all_lines, line_index)
     
     return None
@@ -66,7 +121,7 @@ def extract_error_from_line(line: str, all_lines: List[str], line_index: int) ->
 def extract_python_error(line: str, all_lines: List[str], line_index: int) -> Optional[ErrorContext]:
     """Extract Python error information."""
     # Look for the error message
-    error_match = re.search(r'(\w+Error|\w+Exception): (.+)', line)
+    error_match = _PY_ERROR_RE.search(line)
     if not error_match:
         return None
     
@@ -82,7 +137,7 @@ def extract_python_error(line: str, all_lines: List[str], line_index: int) -> Op
     function_name = None
     
     for i in range(line_index - 1, max(0, line_index - 10), -1):
-        file_match = re.search(r'File "(.*?)", line (\d+), in (.+)', all_lines[i])
+        file_match = _FILE_LINE_RE.search(all_lines[i])
         if file_match:
             file_path = file_match.group(1)
             line_number = int(file_match.group(2))
@@ -106,7 +161,7 @@ def extract_python_error(line: str, all_lines: List[str], line_index: int) -> Op
 def extract_javascript_error(line: str, all_lines: List[str], line_index: int) -> Optional[ErrorContext]:
     """Extract JavaScript error information."""
     # Look for error message
-    error_match = re.search(r'(\w+Error): (.+)', line)
+    error_match = _JS_ERROR_RE.search(line)
     if not error_match:
         return None
     
@@ -122,7 +177,7 @@ def extract_javascript_error(line: str, all_lines: List[str], line_index: int) -
     function_name = None
     
     for i in range(line_index + 1, min(len(all_lines), line_index + 10)):
-        stack_match = re.search(r'at (.+) \((.+):(\d+):(\d+)\)', all_lines[i])
+        stack_match = _JS_STACK_RE.search(all_lines[i])
         if stack_match:
             function_name = stack_match.group(1)
             file_path = stack_match.group(2)
@@ -142,7 +197,7 @@ def extract_javascript_error(line: str, all_lines: List[str], line_index: int) -
 def extract_java_error(line: str, all_lines: List[str], line_index: int) -> Optional[ErrorContext]:
     """Extract Java error information."""
     # Look for exception message
-    exception_match = re.search(r'Exception in thread "(.+)" (.+): (.+)', line)
+    exception_match = _JAVA_EXC_RE.search(line)
     if not exception_match:
         return None
     
@@ -159,7 +214,7 @@ def extract_java_error(line: str, all_lines: List[str], line_index: int) -> Opti
     function_name = None
     
     for i in range(line_index + 1, min(len(all_lines), line_index + 10)):
-        stack_match = re.search(r'at (.+)\.(.+)\((.+):(\d+)\)', all_lines[i])
+        stack_match = _JAVA_STACK_RE.search(all_lines[i])
         if stack_match:
             class_name = stack_match.group(1)
             function_name = stack_match.group(2)
@@ -6,6 +6,15 @@ Simple script to run the Bugfree system and keep it running.
 import asyncio
 import signal
 import sys
+
+# uvloop drops the per-message event-loop overhead of the MCP sockets
+# without any code changes; the stock asyncio loop works fine without it
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 from bugfree.core.orchestrator import OrchestratorAgent
 from bugfree.agents.log_agent import LogAgent
 from bugfree.agents.code_agent import CodeAgent